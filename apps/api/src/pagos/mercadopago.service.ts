@@ -24,6 +24,10 @@ export class MercadoPagoService {
   private paymentClient: Payment | null = null;
   private readonly mockMode: boolean;
 
+  // Stand-in local de la API de pagos (solo fuera de producción)
+  private readonly paymentApiBaseUrl: string | null = null;
+  private readonly accessToken: string | null = null;
+
   // Circuit Breakers for external API calls
   private readonly preferenceCircuitBreaker: CircuitBreaker;
   private readonly paymentCircuitBreaker: CircuitBreaker;
@@ -72,10 +76,28 @@ export class MercadoPagoService {
 
       this.preferenceClient = new Preference(this.mercadopagoClient);
       this.paymentClient = new Payment(this.mercadopagoClient);
+      this.accessToken = accessToken;
 
       this.logger.log(
         '✅ MercadoPago SDK initialized successfully with Circuit Breaker protection',
       );
+
+      // Override para tests de carga: consultar pagos contra un stand-in local
+      const baseUrl = this.configService.get<string>(
+        'MERCADOPAGO_API_BASE_URL',
+      );
+      if (baseUrl) {
+        if (this.configService.get<string>('NODE_ENV') === 'production') {
+          this.logger.error(
+            '🚨 MERCADOPAGO_API_BASE_URL ignorado en producción',
+          );
+        } else {
+          this.paymentApiBaseUrl = baseUrl.replace(/\/+$/, '');
+          this.logger.warn(
+            `⚠️  Consultas de pagos redirigidas a ${this.paymentApiBaseUrl}`,
+          );
+        }
+      }
     }
   }
 
@@ -153,6 +175,9 @@ export class MercadoPagoService {
 
     // Ejecutar con circuit breaker protection
     const payment = await this.paymentCircuitBreaker.execute(async () => {
+      if (this.paymentApiBaseUrl) {
+        return await this.fetchPaymentFromBaseUrl(paymentId);
+      }
       return await this.paymentClient!.get({ id: paymentId });
     });
 
@@ -191,6 +216,30 @@ export class MercadoPagoService {
     };
   }
 
+  /**
+   * Consulta GET /v1/payments/:id contra MERCADOPAGO_API_BASE_URL
+   * (mismo contrato que la API real, usado por el stand-in de tests)
+   */
+  private async fetchPaymentFromBaseUrl(
+    paymentId: string,
+  ): Promise<Awaited<ReturnType<Payment['get']>>> {
+    const response = await fetch(
+      `${this.paymentApiBaseUrl}/v1/payments/${encodeURIComponent(paymentId)}`,
+      {
+        headers: { Authorization: `Bearer ${this.accessToken}` },
+        signal: AbortSignal.timeout(5000),
+      },
+    );
+
+    if (!response.ok) {
+      throw new Error(
+        `MercadoPago API respondió HTTP ${response.status} para el pago ${paymentId}`,
+      );
+    }
+
+    return (await response.json()) as Awaited<ReturnType<Payment['get']>>;
+  }
+
   /**
    * Obtiene métricas de los circuit breakers (para monitoring)
    */
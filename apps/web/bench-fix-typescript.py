@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Benchmark de throughput para fix-typescript-advanced.py
+
+Genera un corpus sintético de archivos TSX con una densidad configurable de
+los patrones que atacan las reglas y mide archivos/s, MB/s y memoria pico
+combinando:
+    - serial vs paralelo (multiprocessing)
+    - frío (page cache desalojado con posix_fadvise) vs cacheado
+    - prefiltro por literal vs matching ingenuo (todas las regex siempre)
+
+Las reglas se aplican en memoria sin reescribir los archivos, así el corpus
+queda idéntico entre modos. En los modos paralelos el Pool se crea y se
+calienta (cada worker carga y compila las reglas) antes de empezar a medir:
+el throughput compara el mismo trabajo que el modo serial y el arranque se
+reporta aparte. Cada modo corre en un proceso nuevo para que la
+memoria pico sea comparable. Los resultados se agregan a un archivo JSONL y
+se comparan contra la corrida anterior con el mismo corpus.
+
+Uso:
+    python bench-fix-typescript.py --archivos 1000
+    python bench-fix-typescript.py --archivos 100000 --densidad 0.05 --procesos 8
+"""
+
+import argparse
+import importlib.util
+import json
+import multiprocessing
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+DIRECTORIO_SCRIPT = Path(__file__).resolve().parent
+RESULTADOS_DEFAULT = DIRECTORIO_SCRIPT / ".bench" / "fix-typescript.jsonl"
+
+MODOS = [
+    {"nombre": f"{ejecucion}-{cache}-{matching}",
+     "paralelo": ejecucion == "paralelo",
+     "frio": cache == "frio",
+     "prefiltro": matching == "prefiltro"}
+    for ejecucion in ("serial", "paralelo")
+    for cache in ("frio", "cacheado")
+    for matching in ("ingenuo", "prefiltro")
+]
+
+
+def cargar_fixer():
+    """Importa fix-typescript-advanced.py (el guion impide un import normal)"""
+    ruta = DIRECTORIO_SCRIPT / "fix-typescript-advanced.py"
+    spec = importlib.util.spec_from_file_location("fix_typescript_advanced", ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+def reglas_corpus(fixer):
+    """
+    Todas las reglas aplicadas a todos los archivos (pasada completa tipo
+    fix-ts-errors.sh), sin repetir patrones compartidos entre archivos.
+    """
+    vistas = set()
+    reglas = []
+    for lista in fixer.compilar_reglas().values():
+        for regla in lista:
+            if regla[0].pattern not in vistas:
+                vistas.add(regla[0].pattern)
+                reglas.append(regla)
+    return reglas
+
+
+# =========================================
+# CORPUS SINTÉTICO
+# =========================================
+
+# Fragmentos que disparan alguna regla
+HALLAZGOS = [
+    "      nombre: student.nombre,\n      apellido: student.apellido,\n",
+    "  const top = mostInscritas[0].nombre;\n  const total = mostInscritas[0].totalInscritos;\n",
+    "  const ruta = clase.ruta_curricular_id.nombre;\n",
+    "    if (usuario.id) {\n      await deleteUser(usuario.id);\n    }\n",
+    "    setClase(response);\n    setEstudiantes(response);\n",
+    "  const cupo = clase.cupo_maximo - clase.cupo_disponible;\n",
+    "  <h2>{clase.titulo}</h2>\n",
+    "    setGrupo(response);\n",
+    "  if (clase.ruta_curricular_id) {\n    color = clase.ruta_curricular_id.color;\n  }\n",
+    "  <p>{alerta.nombre}</p>\n",
+    "  const titulo = formData.nombre;\n",
+]
+
+ENTIDADES = ["Clase", "Estudiante", "Docente", "Grupo", "Planificacion", "Evento", "Pago", "Logro"]
+
+
+def _componente(rng, indice):
+    entidad = rng.choice(ENTIDADES)
+    campos = rng.sample(["id", "estado", "fecha", "descripcion", "puntos", "cupos", "nivel", "email"], 4)
+    lineas = [
+        "'use client';\n",
+        "\n",
+        "import { useEffect, useState } from 'react';\n",
+        f"import {{ get{entidad}s }} from '@/lib/api/{entidad.lower()}s.api';\n",
+        f"import type {{ {entidad} }} from '@/types/{entidad.lower()}.types';\n",
+        "\n",
+        f"interface Props{indice} {{\n",
+    ]
+    lineas += [f"  {campo}?: string;\n" for campo in campos]
+    lineas += [
+        "}\n",
+        "\n",
+        f"export default function {entidad}View{indice}(props: Props{indice}) {{\n",
+        f"  const [items, setItems] = useState<{entidad}[]>([]);\n",
+        "  const [loading, setLoading] = useState(true);\n",
+        "\n",
+        "  useEffect(() => {\n",
+        f"    get{entidad}s().then((data) => {{\n",
+        "      setItems(data);\n",
+        "      setLoading(false);\n",
+        "    });\n",
+        "  }, []);\n",
+        "\n",
+        "  if (loading) return <div className=\"animate-pulse\">Cargando...</div>;\n",
+        "\n",
+        "  return (\n",
+        "    <ul className=\"space-y-2\">\n",
+        "      {items.map((item) => (\n",
+        "        <li key={item.id} className=\"rounded-lg border p-4\">\n",
+    ]
+    lineas += [f"          <span>{{String(item.{campo} ?? '')}}</span>\n" for campo in campos]
+    lineas += [
+        "        </li>\n",
+        "      ))}\n",
+        "    </ul>\n",
+        "  );\n",
+        "}\n",
+    ]
+    return lineas
+
+
+def generar_corpus(directorio, archivos, densidad, semilla=42):
+    """
+    Genera `archivos` componentes TSX en `directorio`. Una fracción
+    `densidad` de ellos incluye entre 1 y 3 fragmentos que disparan reglas.
+    Si ya existe un corpus con los mismos parámetros se reutiliza.
+    """
+    manifiesto = directorio / "corpus.json"
+    parametros = {"archivos": archivos, "densidad": densidad, "semilla": semilla}
+    if manifiesto.exists() and json.loads(manifiesto.read_text()).get("parametros") == parametros:
+        return json.loads(manifiesto.read_text())
+
+    print(f"📝 Generando corpus de {archivos} archivos en {directorio}...")
+    rng = random.Random(semilla)
+    total_bytes = 0
+    con_hallazgos = 0
+    for i in range(archivos):
+        carpeta = directorio / "src" / "app" / f"modulo-{i // 500:03d}"
+        if i % 500 == 0:
+            carpeta.mkdir(parents=True, exist_ok=True)
+        lineas = _componente(rng, i)
+        if rng.random() < densidad:
+            con_hallazgos += 1
+            for _ in range(rng.randint(1, 3)):
+                lineas.insert(rng.randint(12, len(lineas) - 6), rng.choice(HALLAZGOS))
+        contenido = "".join(lineas).encode()
+        (carpeta / f"componente-{i:06d}.tsx").write_bytes(contenido)
+        total_bytes += len(contenido)
+
+    datos = {"parametros": parametros, "bytes": total_bytes, "con_hallazgos": con_hallazgos}
+    manifiesto.write_text(json.dumps(datos))
+    return datos
+
+
+def listar_corpus(directorio):
+    return sorted(str(p) for p in (directorio / "src").rglob("*.tsx"))
+
+
+# =========================================
+# MEDICIÓN (corre en un proceso hijo)
+# =========================================
+
+_REGLAS = None
+_APLICAR = None
+
+
+def _inicializar_worker(barrera=None):
+    """Carga y compila las reglas una vez por proceso"""
+    global _REGLAS, _APLICAR
+    fixer = cargar_fixer()
+    _REGLAS = reglas_corpus(fixer)
+    _APLICAR = fixer.aplicar_reglas
+    if barrera is not None:
+        barrera.wait()
+
+
+def _procesar(args):
+    rutas, prefiltro = args
+    total_bytes = 0
+    cambios = 0
+    for ruta in rutas:
+        with open(ruta, "rb") as f:
+            datos = f.read()
+        total_bytes += len(datos)
+        contenido = datos.decode()
+        if _APLICAR(contenido, _REGLAS, prefiltro) != contenido:
+            cambios += 1
+    return len(rutas), total_bytes, cambios
+
+
+def desalojar_page_cache(rutas):
+    """Pide al kernel que descarte las páginas cacheadas de cada archivo"""
+    # DONTNEED no descarta páginas sucias: un corpus recién escrito seguiría
+    # en memoria, así que primero se fuerza la escritura a disco
+    os.sync()
+    for ruta in rutas:
+        fd = os.open(ruta, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def calentar_page_cache(rutas):
+    for ruta in rutas:
+        with open(ruta, "rb") as f:
+            f.read()
+
+
+def medir(config):
+    """Ejecuta un modo y devuelve sus métricas"""
+    _inicializar_worker()
+
+    rutas = listar_corpus(Path(config["corpus"]))
+    if config["frio"]:
+        desalojar_page_cache(rutas)
+    else:
+        calentar_page_cache(rutas)
+
+    tamanio_lote = 256
+    lotes = [(rutas[i:i + tamanio_lote], config["prefiltro"]) for i in range(0, len(rutas), tamanio_lote)]
+
+    arranque = 0.0
+    if config["paralelo"]:
+        # Arranque fuera de la medición: fork + carga de reglas en cada worker
+        inicio = time.perf_counter()
+        barrera = multiprocessing.Barrier(config["procesos"] + 1)
+        with multiprocessing.Pool(config["procesos"], initializer=_inicializar_worker,
+                                  initargs=(barrera,)) as pool:
+            barrera.wait(timeout=60)
+            arranque = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            parciales = pool.map(_procesar, lotes)
+            segundos = time.perf_counter() - inicio
+    else:
+        inicio = time.perf_counter()
+        parciales = [_procesar(lote) for lote in lotes]
+        segundos = time.perf_counter() - inicio
+
+    archivos = sum(p[0] for p in parciales)
+    total_bytes = sum(p[1] for p in parciales)
+    # ru_maxrss está en KB en Linux
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss_hijos_kb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+
+    return {
+        "segundos": round(segundos, 4),
+        "arranque_pool_seg": round(arranque, 4),
+        "archivos": archivos,
+        "archivos_por_seg": round(archivos / segundos, 1),
+        "mb_por_seg": round(total_bytes / segundos / 1024 / 1024, 2),
+        "archivos_modificados": sum(p[2] for p in parciales),
+        "rss_pico_kb": rss_kb,
+        "rss_pico_worker_kb": rss_hijos_kb,
+    }
+
+
+def medir_en_subproceso(config):
+    r = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), "--_medir", json.dumps(config)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(r.stdout)
+
+
+# =========================================
+# RESULTADOS
+# =========================================
+
+def git_sha():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=DIRECTORIO_SCRIPT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def corrida_anterior(archivo, archivos, densidad):
+    if not archivo.exists():
+        return None
+    anterior = None
+    for linea in archivo.read_text().splitlines():
+        corrida = json.loads(linea)
+        if corrida["corpus"]["archivos"] == archivos and corrida["corpus"]["densidad"] == densidad:
+            anterior = corrida
+    return anterior
+
+
+def guardar(archivo, corrida):
+    archivo.parent.mkdir(parents=True, exist_ok=True)
+    with archivo.open("a") as f:
+        f.write(json.dumps(corrida) + "\n")
+
+
+def imprimir(corrida, anterior):
+    print()
+    print(f"{'modo':<32} {'arch/s':>10} {'MB/s':>8} {'RSS pico':>10} {'vs anterior':>12} {'arranque':>9}")
+    print("-" * 86)
+    for nombre, m in corrida["modos"].items():
+        rss_mb = max(m["rss_pico_kb"], m["rss_pico_worker_kb"]) / 1024
+        delta = ""
+        if anterior and nombre in anterior["modos"]:
+            previo = anterior["modos"][nombre]["archivos_por_seg"]
+            delta = f"{(m['archivos_por_seg'] - previo) / previo * 100:+.1f}%"
+        # Corridas viejas no tienen arranque_pool_seg
+        arranque = f"{m['arranque_pool_seg']:.3f}s" if m.get("arranque_pool_seg") else ""
+        print(f"{nombre:<32} {m['archivos_por_seg']:>10.1f} {m['mb_por_seg']:>8.2f} {rss_mb:>8.1f}MB "
+              f"{delta:>12} {arranque:>9}")
+    if anterior:
+        print(f"\n(comparado con corrida del {anterior['fecha']}, commit {anterior['git_sha']})")
+
+
+def main():
+    if len(sys.argv) == 3 and sys.argv[1] == "--_medir":
+        print(json.dumps(medir(json.loads(sys.argv[2]))))
+        return
+
+    parser = argparse.ArgumentParser(description="Benchmark de fix-typescript-advanced.py")
+    parser.add_argument("--archivos", type=int, default=1000, help="Tamaño del corpus (1k-100k)")
+    parser.add_argument("--densidad", type=float, default=0.1,
+                        help="Fracción de archivos con patrones que disparan reglas")
+    parser.add_argument("--procesos", type=int, default=os.cpu_count(), help="Procesos en modo paralelo")
+    parser.add_argument("--repeticiones", type=int, default=3, help="Se reporta la mejor de N")
+    parser.add_argument("--corpus", type=Path, default=None, help="Directorio del corpus")
+    parser.add_argument("--resultados", type=Path, default=RESULTADOS_DEFAULT, help="Archivo JSONL de resultados")
+    parser.add_argument("--modos", nargs="*", choices=[m["nombre"] for m in MODOS], help="Subconjunto de modos")
+    args = parser.parse_args()
+
+    corpus = args.corpus or Path(f"/tmp/mateatletas-bench-fix-ts-{args.archivos}")
+    corpus.mkdir(parents=True, exist_ok=True)
+    datos_corpus = generar_corpus(corpus, args.archivos, args.densidad)
+
+    print(f"🏁 Corpus: {args.archivos} archivos, {datos_corpus['bytes'] / 1024 / 1024:.1f} MB, "
+          f"{datos_corpus['con_hallazgos']} con hallazgos")
+
+    modos = [m for m in MODOS if not args.modos or m["nombre"] in args.modos]
+    resultados = {}
+    for modo in modos:
+        config = dict(modo, corpus=str(corpus), procesos=args.procesos)
+        mejores = [medir_en_subproceso(config) for _ in range(args.repeticiones)]
+        resultados[modo["nombre"]] = max(mejores, key=lambda m: m["archivos_por_seg"])
+        print(f"  ✓ {modo['nombre']}: {resultados[modo['nombre']]['archivos_por_seg']:.1f} archivos/s")
+
+    corrida = {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "git_sha": git_sha(),
+        "corpus": {"archivos": args.archivos, "densidad": args.densidad, "bytes": datos_corpus["bytes"]},
+        "procesos": args.procesos,
+        "repeticiones": args.repeticiones,
+        "modos": resultados,
+    }
+    anterior = corrida_anterior(args.resultados, args.archivos, args.densidad)
+    guardar(args.resultados, corrida)
+    imprimir(corrida, anterior)
+    print(f"\n💾 Resultados guardados en {args.resultados}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,119 +2,63 @@
 """
 Script avanzado para arreglar errores TypeScript complejos
 que requieren análisis de contexto.
+
+Uso:
+    python fix-typescript-advanced.py              # Pasada única sobre las reglas
+    python fix-typescript-advanced.py --watch      # Modo watch (inotify)
+    python fix-typescript-advanced.py --dir apps/web --watch --debounce-ms 200
+    python -m doctest fix-typescript-advanced.py   # Casos del prefiltro
 """
 
-import re
+import argparse
+import ctypes
+import ctypes.util
 import os
+import re
+import select
+import struct
+import sys
+import time
 from pathlib import Path
 
-def fix_reportes_page():
-    """Arregla src/app/admin/reportes/page.tsx"""
-    file_path = Path("src/app/admin/reportes/page.tsx")
-    if not file_path.exists():
-        return
-    
-    content = file_path.read_text()
-    
-    # Fix 1: string | undefined → string con fallback
-    # Líneas 44-45, 271-272, 280-281
-    content = re.sub(
-        r'nombre: student\.nombre,',
-        'nombre: student.nombre ?? "",',
-        content
-    )
-    content = re.sub(
-        r'apellido: student\.apellido,',
-        'apellido: student.apellido ?? "",',
-        content
-    )
-    
-    # Fix 2: Object possibly undefined (líneas 215, 217)
-    # Agregar optional chaining
-    content = re.sub(
-        r'mostInscritas\[(\d+)\]\.nombre',
-        r'mostInscritas[\1]?.nombre ?? ""',
-        content
-    )
-    content = re.sub(
-        r'mostInscritas\[(\d+)\]\.totalInscritos',
-        r'mostInscritas[\1]?.totalInscritos ?? 0',
-        content
-    )
-    
-    # Fix 3: ruta_curricular_id.nombre (es un ID, no un objeto)
-    content = re.sub(
-        r'clase\.ruta_curricular_id\.nombre',
-        'clase.rutaCurricular?.nombre ?? "Sin ruta"',
-        content
-    )
-    
-    file_path.write_text(content)
-    print(f"✓ Arreglado: {file_path}")
-
-def fix_usuarios_page():
-    """Arregla src/app/admin/usuarios/page.tsx"""
-    file_path = Path("src/app/admin/usuarios/page.tsx")
-    if not file_path.exists():
-        return
-    
-    content = file_path.read_text()
-    
-    # Fix: string | undefined en handleDeleteUser
-    # Línea 96: usuario.id puede ser undefined
-    content = re.sub(
-        r'if \(usuario\.id\)',
-        r'if (usuario?.id)',
-        content
-    )
-    content = re.sub(
-        r'await deleteUser\(usuario\.id\)',
-        r'await deleteUser(usuario.id!)', # Non-null assertion ya que está validado
-        content
-    )
-    
-    file_path.write_text(content)
-    print(f"✓ Arreglado: {file_path}")
-
-def fix_sala_pages():
-    """Arregla las páginas de sala con Axios response types"""
-    files = [
-        "src/app/clase/[id]/sala/page.tsx",
-        "src/app/docente/clase/[id]/sala/page.tsx"
-    ]
-    
-    for file_path_str in files:
-        file_path = Path(file_path_str)
-        if not file_path.exists():
-            continue
-        
-        content = file_path.read_text()
-        
-        # Fix: AxiosResponse<any> → Extraer .data
-        content = re.sub(
-            r'setClase\(response\)',
-            'setClase(response.data)',
-            content
-        )
-        content = re.sub(
-            r'setEstudiantes\(response\)',
-            'setEstudiantes(response.data)',
-            content
-        )
-        
-        file_path.write_text(content)
-        print(f"✓ Arreglado: {file_path}")
-
-def fix_docente_asistencia():
-    """Arregla src/app/docente/clases/[id]/asistencia/page.tsx"""
-    file_path = Path("src/app/docente/clases/[id]/asistencia/page.tsx")
-    if not file_path.exists():
-        return
-    
-    content = file_path.read_text()
-    
-    # Fix: Property mismatches múltiples
-    replacements = [
+DIRECTORIO_WEB = "~/Documentos/Mateatletas-Ecosystem/apps/web"
+
+# =========================================
+# REGLAS POR ARCHIVO
+# =========================================
+# Ruta relativa a apps/web -> lista ordenada de (patrón, reemplazo).
+# El orden importa: cada reemplazo se aplica sobre el resultado del anterior.
+
+_REGLAS_SALA = [
+    # Fix: AxiosResponse<any> → Extraer .data
+    (r'setClase\(response\)', 'setClase(response.data)'),
+    (r'setEstudiantes\(response\)', 'setEstudiantes(response.data)'),
+]
+
+REGLAS = {
+    "src/app/admin/reportes/page.tsx": [
+        # Fix 1: string | undefined → string con fallback
+        # Líneas 44-45, 271-272, 280-281
+        (r'nombre: student\.nombre,', 'nombre: student.nombre ?? "",'),
+        (r'apellido: student\.apellido,', 'apellido: student.apellido ?? "",'),
+        # Fix 2: Object possibly undefined (líneas 215, 217)
+        # Agregar optional chaining
+        (r'mostInscritas\[(\d+)\]\.nombre', r'mostInscritas[\1]?.nombre ?? ""'),
+        (r'mostInscritas\[(\d+)\]\.totalInscritos', r'mostInscritas[\1]?.totalInscritos ?? 0'),
+        # Fix 3: ruta_curricular_id.nombre (es un ID, no un objeto)
+        (r'clase\.ruta_curricular_id\.nombre', 'clase.rutaCurricular?.nombre ?? "Sin ruta"'),
+    ],
+    "src/app/admin/usuarios/page.tsx": [
+        # Fix: string | undefined en handleDeleteUser
+        # Línea 96: usuario.id puede ser undefined
+        (r'if \(usuario\.id\)', r'if (usuario?.id)'),
+        # Non-null assertion ya que está validado
+        (r'await deleteUser\(usuario\.id\)', r'await deleteUser(usuario.id!)'),
+    ],
+    "src/app/clase/[id]/sala/page.tsx": _REGLAS_SALA,
+    "src/app/docente/clase/[id]/sala/page.tsx": _REGLAS_SALA,
+    "src/app/docente/clases/[id]/asistencia/page.tsx": [
+        # Fix: Property mismatches múltiples
         # ruta_curricular (objeto) vs ruta_curricular_id (string)
         (r'clase\.ruta_curricular\.', 'clase.rutaCurricular?.'),
         # cupo_maximo vs cupos_maximo
@@ -123,120 +67,342 @@ def fix_docente_asistencia():
         (r'clase\.cupo_disponible', 'clase.cupos_maximo - clase.cupos_ocupados'),
         # titulo vs nombre
         (r'clase\.titulo', 'clase.nombre'),
-    ]
-    
-    for pattern, replacement in replacements:
-        content = re.sub(pattern, replacement, content)
-    
-    file_path.write_text(content)
-    print(f"✓ Arreglado: {file_path}")
-
-def fix_grupo_page():
-    """Arregla src/app/docente/grupos/[id]/page.tsx"""
-    file_path = Path("src/app/docente/grupos/[id]/page.tsx")
-    if not file_path.exists():
-        return
-    
-    content = file_path.read_text()
-    
-    # Fix: Axios response type
-    content = re.sub(
-        r'setGrupo\(response\)',
-        'setGrupo(response.data)',
-        content
-    )
-    
-    file_path.write_text(content)
-    print(f"✓ Arreglado: {file_path}")
-
-def fix_calendario_tab():
-    """Arregla CalendarioTab con accesos a ruta_curricular"""
-    file_path = Path("src/app/(protected)/dashboard/components/CalendarioTab.tsx")
-    if not file_path.exists():
-        return
-    
-    content = file_path.read_text()
-    
-    # ruta_curricular_id es solo un ID, no tiene .nombre ni .color
-    # Necesita acceder al objeto completo de rutaCurricular
-    content = re.sub(
-        r'clase\.ruta_curricular_id\.nombre',
-        'clase.rutaCurricular?.nombre ?? "Sin asignar"',
-        content
-    )
-    content = re.sub(
-        r'clase\.ruta_curricular_id\.color',
-        'clase.rutaCurricular?.color ?? "#94a3b8"',
-        content
-    )
-    
-    # Agregar null checks
-    content = re.sub(
-        r'if \(clase\.ruta_curricular_id\)',
-        'if (clase.ruta_curricular_id && clase.rutaCurricular)',
-        content
-    )
-    
-    file_path.write_text(content)
-    print(f"✓ Arreglado: {file_path}")
-
-def fix_dashboard_view():
-    """Arregla DashboardView alerta.nombre"""
-    file_path = Path("src/app/(protected)/dashboard/components/DashboardView.tsx")
-    if not file_path.exists():
-        return
-    
-    content = file_path.read_text()
-    
-    # alerta.nombre no existe en AlertaDashboard
-    # Necesitamos ver qué propiedad debería ser
-    # Por contexto, probablemente sea alerta.mensaje o alerta.titulo
-    content = re.sub(
-        r'alerta\.nombre',
-        'alerta.mensaje ?? alerta.titulo',
-        content
-    )
-    
-    file_path.write_text(content)
-    print(f"✓ Arreglado: {file_path}")
-
-def fix_planificacion_modal():
-    """Arregla CreatePlanificacionModal"""
-    file_path = Path("src/app/admin/planificaciones/components/CreatePlanificacionModal.tsx")
-    if not file_path.exists():
-        return
-    
-    content = file_path.read_text()
-    
-    # formData.nombre no existe, debería ser formData.titulo
-    content = re.sub(
-        r'formData\.nombre',
-        'formData.titulo',
-        content
-    )
-    
-    file_path.write_text(content)
-    print(f"✓ Arreglado: {file_path}")
+    ],
+    "src/app/docente/grupos/[id]/page.tsx": [
+        # Fix: Axios response type
+        (r'setGrupo\(response\)', 'setGrupo(response.data)'),
+    ],
+    "src/app/(protected)/dashboard/components/CalendarioTab.tsx": [
+        # ruta_curricular_id es solo un ID, no tiene .nombre ni .color
+        # Necesita acceder al objeto completo de rutaCurricular
+        (r'clase\.ruta_curricular_id\.nombre', 'clase.rutaCurricular?.nombre ?? "Sin asignar"'),
+        (r'clase\.ruta_curricular_id\.color', 'clase.rutaCurricular?.color ?? "#94a3b8"'),
+        # Agregar null checks
+        (r'if \(clase\.ruta_curricular_id\)', 'if (clase.ruta_curricular_id && clase.rutaCurricular)'),
+    ],
+    "src/app/(protected)/dashboard/components/DashboardView.tsx": [
+        # alerta.nombre no existe en AlertaDashboard
+        # Por contexto, probablemente sea alerta.mensaje o alerta.titulo
+        (r'alerta\.nombre', 'alerta.mensaje ?? alerta.titulo'),
+    ],
+    "src/app/admin/planificaciones/components/CreatePlanificacionModal.tsx": [
+        # formData.nombre no existe, debería ser formData.titulo
+        (r'formData\.nombre', 'formData.titulo'),
+    ],
+}
+
+
+_CUANTIFICADORES = set("*+?")
+# {m}, {m,}, {m,n} y {,n}; cualquier otra llave es un literal
+_LLAVES_CUANTIFICADOR = re.compile(r"\{(?:\d+(?:,\d*)?|,\d+)\}")
+
+
+def literal_requerido(patron):
+    """
+    Devuelve el tramo literal más largo que todo match del patrón contiene.
+
+    Sirve de prefiltro: si el literal no aparece en el archivo (un simple
+    `in` sobre el string), la regex no puede matchear y se evita correrla.
+    Es conservador: sólo cuenta literales fuera de grupos y de clases de
+    caracteres, y con alternancias devuelve "" (sin prefiltro).
+
+    >>> literal_requerido(r'clase\.ruta_curricular_id\.nombre')
+    'clase.ruta_curricular_id.nombre'
+    >>> literal_requerido(r'x{2}y')
+    'y'
+    >>> literal_requerido(r'ab{0,1}c')
+    'a'
+    >>> literal_requerido(r'usuario{,3}\.id')
+    'usuari'
+    >>> literal_requerido(r'item{id}')
+    'item{id}'
+    >>> literal_requerido(r'set(Clase|Grupo)')
+    ''
+    """
+    if "|" in patron:
+        return ""
+
+    tramos = []
+    actual = []
+    profundidad = 0
+    i = 0
+    while i < len(patron):
+        c = patron[i]
+        literal = None
+        if c == "\\" and i + 1 < len(patron):
+            # \. \( ... son literales; \d, \w, \1 ... no
+            if not patron[i + 1].isalnum():
+                literal = patron[i + 1]
+            i += 2
+        elif c == "[":
+            # Saltear la clase de caracteres completa
+            i += 1
+            while i < len(patron) and patron[i] != "]":
+                i += 2 if patron[i] == "\\" else 1
+            i += 1
+        elif c == "(":
+            profundidad += 1
+            i += 1
+        elif c == ")":
+            profundidad -= 1
+            i += 1
+        elif c == "{" and _LLAVES_CUANTIFICADOR.match(patron, i):
+            # Saltear el cuantificador completo: sus dígitos no son literales
+            i = _LLAVES_CUANTIFICADOR.match(patron, i).end()
+        elif c in ".^$*+?":
+            i += 1
+        else:
+            literal = c
+            i += 1
+
+        opcional = i < len(patron) and (
+            patron[i] in _CUANTIFICADORES or _LLAVES_CUANTIFICADOR.match(patron, i) is not None
+        )
+        if literal is not None and profundidad == 0 and not opcional:
+            actual.append(literal)
+        else:
+            tramos.append("".join(actual))
+            actual = []
+    tramos.append("".join(actual))
+    return max(tramos, key=len)
+
+
+def compilar_reglas(reglas=REGLAS):
+    """
+    Compila los patrones una sola vez.
+
+    Returns:
+        dict: Path relativo -> lista de (re.Pattern, reemplazo, literal)
+    """
+    return {
+        Path(ruta): [
+            (re.compile(patron), reemplazo, literal_requerido(patron))
+            for patron, reemplazo in lista
+        ]
+        for ruta, lista in reglas.items()
+    }
+
+
+def aplicar_reglas(contenido, reglas, prefiltro=True):
+    """
+    Aplica en orden una lista de reglas compiladas sobre el contenido.
+
+    Con `prefiltro` se saltea cada regex cuyo literal requerido no está
+    presente en el contenido actual.
+    """
+    for patron, reemplazo, literal in reglas:
+        if prefiltro and literal and literal not in contenido:
+            continue
+        contenido = patron.sub(reemplazo, contenido)
+    return contenido
+
+
+def arreglar_archivo(file_path, reglas, cache=None):
+    """
+    Aplica las reglas a un archivo y lo reescribe sólo si cambió.
+
+    Args:
+        file_path: Ruta del archivo
+        reglas: Lista de reglas compiladas para ese archivo
+        cache: dict opcional ruta -> último contenido conocido. Si el
+            contenido en disco coincide con el cacheado no se vuelve a
+            procesar (evita reprocesar nuestras propias escrituras).
+
+    Returns:
+        bool: True si el archivo fue modificado
+    """
+    try:
+        content = file_path.read_text()
+    except (FileNotFoundError, IsADirectoryError):
+        if cache is not None:
+            cache.pop(file_path, None)
+        return False
+
+    if cache is not None and cache.get(file_path) == content:
+        return False
+
+    fixed = aplicar_reglas(content, reglas)
+    if fixed != content:
+        file_path.write_text(fixed)
+    if cache is not None:
+        cache[file_path] = fixed
+    return fixed != content
+
+
+def arreglar_todo(reglas_compiladas, cache=None):
+    """Pasada completa sobre todos los archivos con reglas"""
+    for file_path, reglas in reglas_compiladas.items():
+        if not file_path.exists():
+            continue
+        if arreglar_archivo(file_path, reglas, cache):
+            print(f"✓ Arreglado: {file_path}")
+        else:
+            print(f"· Sin cambios: {file_path}")
+
+
+# =========================================
+# MODO WATCH (inotify)
+# =========================================
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# IN_CREATE sólo se usa para directorios nuevos: un archivo recién creado
+# puede estar a medio escribir; su IN_CLOSE_WRITE llega al terminar
+MASCARA_WATCH = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+EVENTO = struct.Struct("iIII")  # wd, mask, cookie, len
+DIRECTORIOS_IGNORADOS = {"node_modules", ".next", ".git", ".turbo", "dist", "coverage"}
+
+
+class Inotify:
+    """Envoltorio mínimo sobre inotify(7) vía ctypes, sin dependencias externas"""
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("inotify no está disponible en esta plataforma")
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 falló")
+        self._dirs = {}
+
+    def agregar_directorio(self, directorio):
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directorio), MASCARA_WATCH)
+        if wd < 0:
+            return
+        self._dirs[wd] = Path(directorio)
+
+    def agregar_arbol(self, raiz):
+        for dirpath, dirnames, _ in os.walk(raiz):
+            dirnames[:] = [d for d in dirnames if d not in DIRECTORIOS_IGNORADOS]
+            self.agregar_directorio(dirpath)
+
+    def leer(self):
+        """Devuelve la lista de rutas de archivos tocados desde la última lectura"""
+        rutas = []
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return rutas
+
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _, length = EVENTO.unpack_from(buf, offset)
+            name = buf[offset + EVENTO.size:offset + EVENTO.size + length].rstrip(b"\0")
+            offset += EVENTO.size + length
+
+            if mask & IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            base = self._dirs.get(wd)
+            if base is None or not name:
+                continue
+            ruta = base / os.fsdecode(name)
+            if mask & IN_ISDIR:
+                # Directorios nuevos (p. ej. tras un git checkout)
+                if ruta.name not in DIRECTORIOS_IGNORADOS:
+                    self.agregar_arbol(ruta)
+                continue
+            if mask & IN_CREATE:
+                continue
+            rutas.append(ruta)
+        return rutas
+
+    def cerrar(self):
+        os.close(self.fd)
+
+
+def vigilar(reglas_compiladas, debounce=0.15, espera_maxima=1.0):
+    """
+    Vigila src/ y re-aplica las reglas sólo al archivo guardado.
+
+    Las ráfagas de eventos (editores que guardan varias veces, git checkout)
+    se agrupan: se procesa cuando pasan `debounce` segundos sin eventos, o
+    como mucho `espera_maxima` segundos después del primer evento pendiente.
+    """
+    try:
+        inotify = Inotify()
+    except OSError as e:
+        print(f"Error: no se pudo iniciar el modo watch: {e}")
+        sys.exit(1)
+
+    raiz = Path("src")
+    inotify.agregar_arbol(raiz)
+
+    # Caché en memoria: evita reprocesar nuestras propias escrituras
+    cache = {}
+    arreglar_todo(reglas_compiladas, cache)
+
+    print()
+    print(f"👀 Vigilando {raiz.resolve()} (Ctrl+C para salir)...")
+
+    pendientes = set()
+    primer_evento = ultimo_evento = 0.0
+    try:
+        while True:
+            if pendientes:
+                ahora = time.monotonic()
+                timeout = max(0.0, min(ultimo_evento + debounce, primer_evento + espera_maxima) - ahora)
+            else:
+                timeout = None
+
+            listos, _, _ = select.select([inotify.fd], [], [], timeout)
+            if listos:
+                for ruta in inotify.leer():
+                    # Sólo interesan archivos con reglas
+                    if ruta in reglas_compiladas:
+                        if not pendientes:
+                            primer_evento = time.monotonic()
+                        pendientes.add(ruta)
+                        ultimo_evento = time.monotonic()
+                # Eventos continuos no postergan más allá de espera_maxima
+                if not pendientes or time.monotonic() < primer_evento + espera_maxima:
+                    continue
+
+            for ruta in sorted(pendientes):
+                inicio = time.perf_counter()
+                if arreglar_archivo(ruta, reglas_compiladas[ruta], cache):
+                    ms = (time.perf_counter() - inicio) * 1000
+                    print(f"✓ Arreglado: {ruta} ({ms:.1f} ms)")
+            pendientes.clear()
+    except KeyboardInterrupt:
+        print()
+        print("👋 Modo watch finalizado")
+    finally:
+        inotify.cerrar()
+
 
 def main():
+    parser = argparse.ArgumentParser(description="Fixes avanzados de errores TypeScript")
+    parser.add_argument("--dir", default=DIRECTORIO_WEB, help="Directorio apps/web")
+    parser.add_argument("--watch", action="store_true", help="Re-aplicar reglas al guardar cada archivo")
+    parser.add_argument("--debounce-ms", type=int, default=150, help="Ventana de agrupación de eventos")
+    args = parser.parse_args()
+
     print("🐍 Ejecutando fixes avanzados con Python...")
     print()
-    
+
     # Cambiar al directorio web
-    os.chdir(os.path.expanduser("~/Documentos/Mateatletas-Ecosystem/apps/web"))
-    
+    os.chdir(os.path.expanduser(args.dir))
+
+    reglas_compiladas = compilar_reglas()
+
+    if args.watch:
+        vigilar(reglas_compiladas, debounce=args.debounce_ms / 1000)
+        return
+
     # Ejecutar todos los fixes
-    fix_reportes_page()
-    fix_usuarios_page()
-    fix_sala_pages()
-    fix_docente_asistencia()
-    fix_grupo_page()
-    fix_calendario_tab()
-    fix_dashboard_view()
-    fix_planificacion_modal()
-    
+    arreglar_todo(reglas_compiladas)
+
     print()
     print("✅ Fixes avanzados completados")
 
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,539 @@
+#!/usr/bin/env python3
+"""
+Benchmark de renderizado HTML -> PDF (html_to_pdf / WeasyPrint)
+
+Genera un corpus sintético modelado sobre los documentos reales:
+    - directiva: como colonia-directiva-docentes-2026.html (~20 KB de HTML
+      con gradientes, grillas, sombras y tarjetas por profesor/curso)
+    - credenciales-N: planillas de credenciales (usuario, PIN y tutor como
+      en CredencialesModal) para N estudiantes, con un logo por tarjeta
+    - dos controles con el mismo N: sin imágenes y con CSS simple, para
+      separar el costo de las imágenes y de los estilos
+
+y mide segundos por documento, páginas/s, memoria pico (RSS) y tamaño del
+PDF en tres modos:
+    - single-shot: un proceso nuevo por documento (como la CLI)
+    - batch: un solo proceso que renderiza todos los documentos en serie
+    - warm-worker: procesos ya inicializados y en caliente que reciben el
+      HTML y devuelven el PDF en memoria (como un sidecar de la API)
+
+Cada combinación corre en un proceso coordinador nuevo para que la memoria
+pico sea comparable. Los resultados se agregan a un archivo JSONL y se
+comparan contra la corrida anterior con el mismo corpus.
+
+Uso:
+    python bench-html-to-pdf.py
+    python bench-html-to-pdf.py --estudiantes 1 100 1000 --documentos 5
+    python bench-html-to-pdf.py --modos warm-worker --procesos 4
+"""
+
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from threading import BrokenBarrierError
+
+DIRECTORIO_SCRIPT = Path(__file__).resolve().parent
+DIRECTORIO_WEB = DIRECTORIO_SCRIPT.parent
+RESULTADOS_DEFAULT = DIRECTORIO_WEB / ".bench" / "html-to-pdf.jsonl"
+
+MODOS = ["single-shot", "batch", "warm-worker"]
+# Si un worker no termina de calentar en este tiempo (p. ej. falla el render
+# de prueba y el Pool relanza el initializer sin fin) se aborta el modo
+TIMEOUT_CALENTAMIENTO = 120
+
+# =========================================
+# CORPUS SINTÉTICO
+# =========================================
+
+NOMBRES = ["Sofía", "Mateo", "Valentina", "Santiago", "Isabella", "Benjamín", "Emma", "Thiago",
+           "Martina", "Joaquín", "Catalina", "Lautaro", "Olivia", "Bautista", "Mía", "Felipe"]
+APELLIDOS = ["González", "Rodríguez", "Fernández", "López", "Martínez", "Pérez", "Gómez", "Díaz",
+             "Sánchez", "Romero", "Sosa", "Torres", "Álvarez", "Ruiz", "Benítez", "Acosta"]
+PROFESORES = ["Gimena", "Alexis", "Fernanda", "Sebastián", "Lucía", "Martín"]
+CURSOS = ["Matemática con Juegos y Desafíos", "Geometría en Movimiento", "Lógica y Acertijos",
+          "Programación con Scratch", "Robótica Inicial", "Astronomía para Curiosos",
+          "Álgebra Detective", "Estadística del Deporte", "Ajedrez Matemático"]
+DIAS = ["Lunes", "Martes", "Miércoles", "Jueves"]
+
+CSS_RICO = """
+* { margin: 0; padding: 0; box-sizing: border-box; }
+body {
+  font-family: 'Inter', 'Segoe UI', system-ui, -apple-system, sans-serif;
+  line-height: 1.6; color: #1e293b;
+  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+  padding: 40px 20px;
+}
+.container {
+  max-width: 1000px; margin: 0 auto; background: white;
+  border-radius: 20px; box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3); overflow: hidden;
+}
+.header {
+  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+  color: white; padding: 50px 40px; text-align: center; position: relative; overflow: hidden;
+}
+.header::before {
+  content: ''; position: absolute; top: -50%; left: -50%; width: 200%; height: 200%;
+  background: radial-gradient(circle, rgba(255, 255, 255, 0.1) 0%, transparent 70%);
+}
+.header h1 { font-size: 42px; margin-bottom: 10px; font-weight: 800; text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.2); }
+.header .subtitle { font-size: 20px; opacity: 0.95; font-weight: 300; }
+.content { padding: 40px; }
+.alert-box {
+  background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); color: white;
+  padding: 25px; border-radius: 15px; margin-bottom: 30px;
+  box-shadow: 0 10px 30px rgba(245, 87, 108, 0.3);
+}
+.alert-box li { padding: 8px 0 8px 25px; position: relative; list-style: none; }
+.alert-box li::before { content: '✓'; position: absolute; left: 0; font-weight: bold; }
+.info-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(220px, 1fr)); gap: 20px; margin: 30px 0; }
+.info-card {
+  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white;
+  padding: 25px; border-radius: 15px; text-align: center;
+}
+.section-title { font-size: 28px; color: #4c1d95; border-bottom: 3px solid #a78bfa; margin: 30px 0 20px; }
+.profesor-card {
+  border: 2px solid #e2e8f0; border-radius: 16px; margin-bottom: 24px; padding: 24px;
+  box-shadow: 0 4px 12px rgba(0, 0, 0, 0.06);
+}
+.profesor-header { display: flex; align-items: center; gap: 16px; margin-bottom: 16px; }
+.profesor-avatar {
+  width: 56px; height: 56px; border-radius: 50%; font-size: 28px; text-align: center;
+  background: linear-gradient(135deg, #fde68a 0%, #f59e0b 100%);
+}
+.curso { background: #f8fafc; border-left: 4px solid #8b5cf6; border-radius: 10px; padding: 16px; margin: 12px 0; }
+.curso-meta span { display: inline-block; padding: 4px 12px; border-radius: 999px; font-size: 13px; margin-right: 8px; }
+.edad-tag { background: #dbeafe; color: #1e40af; }
+.horario-tag { background: #dcfce7; color: #166534; }
+.curso-desc { color: #475569; font-size: 14px; margin-top: 8px; }
+@media print {
+  body { background: white; padding: 0; }
+  .container { box-shadow: none; border-radius: 0; }
+  .profesor-card { page-break-inside: avoid; }
+}
+"""
+
+CSS_CREDENCIALES_RICO = """
+@page { size: A4; margin: 12mm; }
+* { margin: 0; padding: 0; box-sizing: border-box; }
+body { font-family: 'Inter', 'Segoe UI', system-ui, sans-serif; color: #1e293b; font-size: 11px; }
+.hoja { display: grid; grid-template-columns: 1fr 1fr; gap: 8mm; }
+.credencial {
+  page-break-inside: avoid; border-radius: 12px; overflow: hidden;
+  border: 1px solid #c4b5fd; box-shadow: 0 4px 10px rgba(76, 29, 149, 0.15);
+}
+.credencial-header {
+  display: flex; align-items: center; gap: 8px; padding: 8px 12px; color: white;
+  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+}
+.credencial-header img { width: 28px; height: 28px; }
+.credencial-header h3 { font-size: 13px; font-weight: 700; }
+.credencial-body { padding: 10px 12px; }
+.campo { display: flex; justify-content: space-between; padding: 4px 8px; margin: 4px 0; border-radius: 6px; background: #f5f3ff; }
+.campo .etiqueta { color: #64748b; }
+.campo .valor { font-family: 'JetBrains Mono', monospace; font-weight: 600; }
+.pin { font-size: 18px; color: #7c3aed; letter-spacing: 2px; }
+.tutor { border-top: 1px dashed #c4b5fd; margin-top: 6px; padding-top: 6px; }
+.pie { font-size: 9px; color: #94a3b8; text-align: center; padding: 4px; background: #faf5ff; }
+"""
+
+CSS_CREDENCIALES_SIMPLE = """
+@page { size: A4; margin: 12mm; }
+body { font-family: sans-serif; font-size: 11px; }
+.credencial { page-break-inside: avoid; border: 1px solid #999; margin-bottom: 6mm; padding: 6px; }
+.credencial-header img { width: 28px; height: 28px; }
+.campo { margin: 2px 0; }
+"""
+
+# Logo chico como data URI (una imagen por tarjeta, sin red ni disco)
+LOGO_SVG = (
+    "data:image/svg+xml;utf8,"
+    "<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 32 32'>"
+    "<circle cx='16' cy='16' r='15' fill='%23fde68a'/>"
+    "<path d='M9 22 L16 8 L23 22 Z' fill='%237c3aed'/></svg>"
+)
+
+
+def generar_directiva(rng, bytes_objetivo=20 * 1024):
+    """HTML con la forma de la directiva de la colonia, de ~`bytes_objetivo`"""
+    partes = [
+        "<!doctype html>\n<html lang=\"es\">\n<head>\n<meta charset=\"UTF-8\" />\n",
+        "<title>Colonia de Verano Mateatletas 2026 - Directiva Docentes</title>\n",
+        f"<style>{CSS_RICO}</style>\n</head>\n<body>\n<div class=\"container\">\n",
+        "<div class=\"header\"><div class=\"header-content\"><h1>🚀 Colonia de Verano 2026</h1>"
+        "<p class=\"subtitle\">Directiva para Docentes - Mateatletas</p></div></div>\n",
+        "<div class=\"content\">\n<div class=\"alert-box\"><h3>📅 Información General</h3><ul>\n",
+        "<li><strong>Inicio:</strong> 5 de enero de 2026</li>\n",
+        "<li><strong>Modalidad:</strong> Virtual sincrónico</li>\n",
+        "<li><strong>Duración de clases:</strong> 90 minutos</li>\n</ul></div>\n",
+        "<div class=\"info-grid\">",
+        "".join(f"<div class=\"info-card\"><h4>{n}</h4><p>{t}</p></div>"
+                for n, t in [(13, "Cursos Totales"), (8, "Semanas"), (4, "Profesores"), (4, "Días Semanales")]),
+        "</div>\n<div class=\"section\"><h2 class=\"section-title\">Asignación de Cursos</h2>\n",
+    ]
+    cierre = "</div>\n</div>\n</div>\n</body>\n</html>\n"
+    tamanio = sum(len(p.encode()) for p in partes) + len(cierre)
+    indice = 0
+    while tamanio < bytes_objetivo:
+        profesor = PROFESORES[indice % len(PROFESORES)]
+        cursos = rng.sample(CURSOS, 3)
+        tarjeta = [
+            "<div class=\"profesor-card\"><div class=\"profesor-header\">",
+            "<div class=\"profesor-avatar\">👩‍🏫</div>",
+            f"<div class=\"profesor-info\"><h3>Profe {profesor}</h3>",
+            f"<p>Área: Matemática | {len(cursos)} cursos asignados</p></div></div>\n",
+        ]
+        for curso in cursos:
+            edad = rng.randint(6, 14)
+            dia = rng.choice(DIAS)
+            tarjeta += [
+                f"<div class=\"curso\"><h4>\"{curso}\"</h4><div class=\"curso-meta\">",
+                f"<span class=\"edad-tag\">{edad}-{edad + 1} años</span>",
+                f"<span class=\"horario-tag\">{dia} 10:30-12:00</span></div>",
+                "<p class=\"curso-desc\">Desafíos semanales, trabajo en equipo y retos de "
+                "gamificación adaptados a la edad del grupo. Cada clase cierra con una "
+                "actividad integradora y suma puntos al ranking de la colonia.</p></div>\n",
+            ]
+        tarjeta.append("</div>\n")
+        partes += tarjeta
+        tamanio += sum(len(p.encode()) for p in tarjeta)
+        indice += 1
+    partes.append(cierre)
+    return "".join(partes)
+
+
+def generar_credenciales(rng, estudiantes, imagenes=True, css=CSS_CREDENCIALES_RICO):
+    """Planilla de credenciales (estudiante + tutor) para `estudiantes` alumnos"""
+    partes = [
+        "<!doctype html>\n<html lang=\"es\">\n<head>\n<meta charset=\"UTF-8\" />\n",
+        f"<title>Credenciales - {estudiantes} estudiantes</title>\n",
+        f"<style>{css}</style>\n</head>\n<body>\n<div class=\"hoja\">\n",
+    ]
+    logo = f"<img src=\"{LOGO_SVG}\" alt=\"\" />" if imagenes else ""
+    for i in range(estudiantes):
+        nombre, apellido = rng.choice(NOMBRES), rng.choice(APELLIDOS)
+        tutor = rng.choice(NOMBRES)
+        usuario = f"{nombre.lower()[:4]}.{apellido.lower()[:4]}{i:04d}"
+        partes.append(
+            "<div class=\"credencial\">"
+            f"<div class=\"credencial-header\">{logo}<h3>{nombre} {apellido}</h3></div>"
+            "<div class=\"credencial-body\">"
+            f"<div class=\"campo\"><span class=\"etiqueta\">Usuario</span><span class=\"valor\">{usuario}</span></div>"
+            f"<div class=\"campo\"><span class=\"etiqueta\">PIN</span><span class=\"valor pin\">{rng.randint(1000, 9999)}</span></div>"
+            "<div class=\"tutor\">"
+            f"<div class=\"campo\"><span class=\"etiqueta\">Tutor</span><span class=\"valor\">{tutor} {apellido}</span></div>"
+            f"<div class=\"campo\"><span class=\"etiqueta\">Contraseña temporal</span><span class=\"valor\">Mt{rng.randint(100000, 999999)}!</span></div>"
+            "</div></div>"
+            "<div class=\"pie\">Portal: https://mateatletas.com/login</div>"
+            "</div>\n"
+        )
+    partes.append("</div>\n</body>\n</html>\n")
+    return "".join(partes)
+
+
+def formas_corpus(estudiantes, control):
+    """
+    Returns:
+        list: [(nombre, generador(rng) -> html)]
+    """
+    formas = [("directiva", generar_directiva)]
+    formas += [
+        (f"credenciales-{n}", lambda rng, n=n: generar_credenciales(rng, n))
+        for n in estudiantes
+    ]
+    if control:
+        formas += [
+            (f"credenciales-{control}-sin-imagenes",
+             lambda rng: generar_credenciales(rng, control, imagenes=False)),
+            (f"credenciales-{control}-css-simple",
+             lambda rng: generar_credenciales(rng, control, css=CSS_CREDENCIALES_SIMPLE)),
+        ]
+    return formas
+
+
+def generar_corpus(directorio, estudiantes, control, semilla=42):
+    """
+    Escribe un HTML por forma en `directorio`. Si ya existe un corpus con
+    los mismos parámetros se reutiliza.
+
+    Returns:
+        dict: nombre -> {"ruta", "bytes"}
+    """
+    manifiesto = directorio / "corpus.json"
+    parametros = {"estudiantes": estudiantes, "control": control, "semilla": semilla}
+    if manifiesto.exists() and json.loads(manifiesto.read_text()).get("parametros") == parametros:
+        return json.loads(manifiesto.read_text())["documentos"]
+
+    print(f"📝 Generando corpus en {directorio}...")
+    documentos = {}
+    for nombre, generador in formas_corpus(estudiantes, control):
+        html = generador(random.Random(f"{semilla}-{nombre}")).encode()
+        ruta = directorio / f"{nombre}.html"
+        ruta.write_bytes(html)
+        documentos[nombre] = {"ruta": str(ruta), "bytes": len(html)}
+
+    manifiesto.write_text(json.dumps({"parametros": parametros, "documentos": documentos}))
+    return documentos
+
+
+# =========================================
+# MEDICIÓN
+# =========================================
+
+def _renderizar(ruta, destino=None):
+    """Renderiza un archivo; devuelve (segundos, páginas, bytes del PDF)"""
+    from html_to_pdf import render_document
+
+    inicio = time.perf_counter()
+    document = render_document(Path(ruta))
+    salida = io.BytesIO() if destino is None else destino
+    document.write_pdf(salida)
+    segundos = time.perf_counter() - inicio
+    tamanio = salida.tell() if destino is None else Path(destino).stat().st_size
+    return segundos, len(document.pages), tamanio
+
+
+def lote(config):
+    """Renderiza en serie en este proceso (batch, o single-shot con un documento)"""
+    import html_to_pdf  # noqa: F401  (la importación entra en el tiempo del proceso)
+
+    salida = config.get("salida")
+    return [_renderizar(config["ruta"], salida) for _ in range(config["documentos"])]
+
+
+def _ejecutar_lote(config):
+    inicio = time.perf_counter()
+    r = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), "--_lote", json.dumps(config)],
+        capture_output=True, text=True, check=True,
+    )
+    return time.perf_counter() - inicio, json.loads(r.stdout)
+
+
+def _calentar(barrera):
+    """Inicializa un worker: importa WeasyPrint y renderiza un documento mínimo"""
+    from html_to_pdf import render_pdf
+
+    render_pdf("<p>calentando</p>")
+    barrera.wait()
+
+
+def _renderizar_en_worker(ruta):
+    from html_to_pdf import render_document
+
+    # El worker recibe el HTML en memoria, como lo haría un sidecar
+    html = Path(ruta).read_bytes()
+    inicio = time.perf_counter()
+    document = render_document(html, base_url=str(Path(ruta).parent))
+    salida = io.BytesIO()
+    document.write_pdf(salida)
+    return time.perf_counter() - inicio, len(document.pages), salida.tell()
+
+
+def medir(config):
+    """Ejecuta un modo sobre un documento y devuelve sus métricas"""
+    documentos = config["documentos"]
+    por_doc = []
+
+    if config["modo"] == "single-shot":
+        salida = Path(config["ruta"]).with_suffix(".pdf")
+        segundos = 0.0
+        for _ in range(documentos):
+            pared, renders = _ejecutar_lote({"ruta": config["ruta"], "documentos": 1, "salida": str(salida)})
+            segundos += pared
+            por_doc.append((pared, *renders[0][1:]))
+    elif config["modo"] == "batch":
+        segundos, renders = _ejecutar_lote({"ruta": config["ruta"], "documentos": documentos})
+        por_doc = [tuple(r) for r in renders]
+    else:
+        procesos = min(config["procesos"], documentos)
+        barrera = multiprocessing.Barrier(procesos + 1)
+        with multiprocessing.Pool(procesos, initializer=_calentar, initargs=(barrera,)) as pool:
+            try:
+                barrera.wait(timeout=TIMEOUT_CALENTAMIENTO)
+            except BrokenBarrierError:
+                # Al salir del with, el Pool termina los workers que quedaron
+                raise RuntimeError(f"los workers no terminaron de calentar en {TIMEOUT_CALENTAMIENTO}s "
+                                   "(¿falla el render de prueba o faltan librerías de WeasyPrint?)") from None
+            inicio = time.perf_counter()
+            por_doc = pool.map(_renderizar_en_worker, [config["ruta"]] * documentos, chunksize=1)
+            segundos = time.perf_counter() - inicio
+            pool.close()
+            pool.join()
+
+    paginas = por_doc[0][1]
+    tiempos = sorted(d[0] for d in por_doc)
+    # ru_maxrss está en KB en Linux; el trabajo pesado corre en procesos hijos
+    rss_kb = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                 resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+
+    return {
+        "documentos": documentos,
+        "paginas": paginas,
+        "segundos": round(segundos, 4),
+        "segundos_por_doc": round(segundos / documentos, 4),
+        "mediana_doc_seg": round(tiempos[len(tiempos) // 2], 4),
+        "primer_doc_seg": round(por_doc[0][0], 4),
+        "paginas_por_seg": round(paginas * documentos / segundos, 2),
+        "bytes_pdf": por_doc[0][2],
+        "rss_pico_kb": rss_kb,
+    }
+
+
+def medir_en_subproceso(config):
+    r = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), "--_medir", json.dumps(config)],
+        capture_output=True, text=True,
+    )
+    if r.returncode != 0:
+        raise RuntimeError(r.stderr.strip().splitlines()[-1] if r.stderr.strip() else f"exit {r.returncode}")
+    return json.loads(r.stdout)
+
+
+# =========================================
+# RESULTADOS
+# =========================================
+
+def git_sha():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=DIRECTORIO_SCRIPT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def version_web():
+    try:
+        return json.loads((DIRECTORIO_WEB / "package.json").read_text()).get("version")
+    except (OSError, ValueError):
+        return None
+
+
+def version_weasyprint():
+    try:
+        import weasyprint
+    except (ImportError, OSError):
+        # OSError: instalado pero sin sus librerías del sistema (Pango)
+        return None
+    return weasyprint.__version__
+
+
+def corrida_anterior(archivo, corpus):
+    if not archivo.exists():
+        return None
+    anterior = None
+    for linea in archivo.read_text().splitlines():
+        corrida = json.loads(linea)
+        if corrida["corpus"]["parametros"] == corpus:
+            anterior = corrida
+    return anterior
+
+
+def guardar(archivo, corrida):
+    archivo.parent.mkdir(parents=True, exist_ok=True)
+    with archivo.open("a") as f:
+        f.write(json.dumps(corrida) + "\n")
+
+
+def imprimir(corrida, anterior):
+    print()
+    print(f"{'documento':<32} {'modo':<12} {'págs':>5} {'s/doc':>8} {'págs/s':>8} "
+          f"{'RSS pico':>10} {'PDF':>9} {'vs anterior':>12}")
+    print("-" * 104)
+    for documento, modos in corrida["resultados"].items():
+        for modo, m in modos.items():
+            if "error" in m:
+                print(f"{documento:<32} {modo:<12} ✗ {m['error']}")
+                continue
+            delta = ""
+            previo = (anterior or {}).get("resultados", {}).get(documento, {}).get(modo, {})
+            if previo.get("segundos_por_doc"):
+                delta = f"{(m['segundos_por_doc'] - previo['segundos_por_doc']) / previo['segundos_por_doc'] * 100:+.1f}%"
+            print(f"{documento:<32} {modo:<12} {m['paginas']:>5} {m['segundos_por_doc']:>8.3f} "
+                  f"{m['paginas_por_seg']:>8.1f} {m['rss_pico_kb'] / 1024:>8.1f}MB "
+                  f"{m['bytes_pdf'] / 1024:>7.1f}KB {delta:>12}")
+    if anterior:
+        print(f"\n(comparado con corrida del {anterior['fecha']}, versión {anterior['version']}, "
+              f"commit {anterior['git_sha']})")
+
+
+def main():
+    if len(sys.argv) == 3 and sys.argv[1] in ("--_medir", "--_lote"):
+        sys.path.insert(0, str(DIRECTORIO_SCRIPT))
+        funcion = medir if sys.argv[1] == "--_medir" else lote
+        print(json.dumps(funcion(json.loads(sys.argv[2]))))
+        return
+
+    parser = argparse.ArgumentParser(description="Benchmark de renderizado HTML -> PDF")
+    parser.add_argument("--estudiantes", type=int, nargs="+", default=[1, 10, 100, 1000, 5000],
+                        help="Tamaños de las planillas de credenciales")
+    parser.add_argument("--control", type=int, default=100,
+                        help="N de las planillas de control sin imágenes / CSS simple (0 para omitirlas)")
+    parser.add_argument("--documentos", type=int, default=3, help="Documentos renderizados por modo")
+    parser.add_argument("--procesos", type=int, default=os.cpu_count(), help="Workers del modo warm-worker")
+    parser.add_argument("--modos", nargs="*", choices=MODOS, help="Subconjunto de modos")
+    parser.add_argument("--solo", nargs="*", help="Subconjunto de documentos (p. ej. directiva credenciales-100)")
+    parser.add_argument("--corpus", type=Path, default=Path("/tmp/mateatletas-bench-html-to-pdf"),
+                        help="Directorio del corpus")
+    parser.add_argument("--resultados", type=Path, default=RESULTADOS_DEFAULT, help="Archivo JSONL de resultados")
+    args = parser.parse_args()
+
+    if version_weasyprint() is None:
+        print("Error: WeasyPrint no está instalado o le faltan sus librerías del sistema (Pango).")
+        print("Instalalo con: pip install weasyprint")
+        sys.exit(1)
+
+    args.corpus.mkdir(parents=True, exist_ok=True)
+    documentos = generar_corpus(args.corpus, args.estudiantes, args.control)
+    if args.solo:
+        documentos = {n: d for n, d in documentos.items() if n in args.solo}
+
+    tamanios = ", ".join(f"{n} {d['bytes'] / 1024:.0f} KB" for n, d in documentos.items())
+    print(f"🏁 Corpus: {len(documentos)} documentos ({tamanios})")
+
+    resultados = {}
+    for nombre, documento in documentos.items():
+        resultados[nombre] = {}
+        for modo in args.modos or MODOS:
+            config = {"modo": modo, "ruta": documento["ruta"],
+                      "documentos": args.documentos, "procesos": args.procesos}
+            try:
+                m = medir_en_subproceso(config)
+                print(f"  ✓ {nombre} [{modo}]: {m['segundos_por_doc']:.3f} s/doc, "
+                      f"{m['paginas_por_seg']:.1f} págs/s")
+            except RuntimeError as e:
+                m = {"error": str(e)}
+                print(f"  ✗ {nombre} [{modo}]: {e}")
+            resultados[nombre][modo] = m
+
+    corrida = {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "version": version_web(),
+        "git_sha": git_sha(),
+        "weasyprint": version_weasyprint(),
+        "corpus": {
+            "parametros": {"estudiantes": args.estudiantes, "control": args.control},
+            "bytes_html": {n: d["bytes"] for n, d in documentos.items()},
+        },
+        "documentos_por_modo": args.documentos,
+        "procesos": args.procesos,
+        "resultados": resultados,
+    }
+    anterior = corrida_anterior(args.resultados, corrida["corpus"]["parametros"])
+    guardar(args.resultados, corrida)
+    imprimir(corrida, anterior)
+    print(f"\n💾 Resultados guardados en {args.resultados}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,17 @@
 #!/usr/bin/env python3
 """
 Script para convertir HTML a PDF usando WeasyPrint
-Uso: python html-to-pdf.py <archivo.html> [archivo-salida.pdf]
+Uso: python html-to-pdf.py <archivo.html|-> [archivo-salida.pdf|-]
+
+Con `-` lee el HTML de stdin y/o escribe el PDF en stdout. Para usarlo
+desde código sin pasar por archivos temporales, importar html_to_pdf.
 """
 
 import sys
 import os
 from pathlib import Path
 
-try:
-    from weasyprint import HTML, CSS
-except ImportError:
-    print("Error: WeasyPrint no está instalado.")
-    print("Instalalo con: pip install weasyprint")
-    sys.exit(1)
+from html_to_pdf import PdfRenderError, convert_file, render_pdf, stream_pdf
 
 
 def convert_html_to_pdf(html_path, pdf_path=None):
@@ -21,36 +19,44 @@ def convert_html_to_pdf(html_path, pdf_path=None):
     Convierte un archivo HTML a PDF
 
     Args:
-        html_path: Ruta al archivo HTML
-        pdf_path: Ruta de salida del PDF (opcional)
+        html_path: Ruta al archivo HTML, o '-' para leer de stdin
+        pdf_path: Ruta de salida del PDF (opcional), o '-' para stdout
     """
-    # Verificar que el archivo HTML existe
-    if not os.path.exists(html_path):
-        print(f"Error: El archivo {html_path} no existe")
-        sys.exit(1)
+    # Con salida a stdout los mensajes van a stderr para no ensuciar el PDF
+    log = sys.stderr if pdf_path == '-' else sys.stdout
 
-    # Si no se especifica PDF de salida, usar el mismo nombre
-    if pdf_path is None:
-        pdf_path = Path(html_path).with_suffix('.pdf')
+    try:
+        if pdf_path == '-':
+            stream_pdf(sys.stdin.buffer if html_path == '-' else Path(html_path))
+            return
 
-    print(f"Convirtiendo {html_path} a {pdf_path}...")
+        if html_path == '-':
+            if pdf_path is None:
+                raise ValueError("Con entrada por stdin hay que indicar el archivo de salida")
+            print(f"Convirtiendo stdin a {pdf_path}...", file=log)
+            # Renderizar antes de abrir la salida: si falla, no queda un PDF vacío
+            pdf = render_pdf(sys.stdin.buffer)
+            with open(pdf_path, 'wb') as salida:
+                salida.write(pdf)
+        else:
+            pdf_path = pdf_path or Path(html_path).with_suffix('.pdf')
+            print(f"Convirtiendo {html_path} a {pdf_path}...", file=log)
+            convert_file(html_path, pdf_path)
 
-    try:
-        # Convertir HTML a PDF
-        HTML(filename=html_path).write_pdf(pdf_path)
-        print(f"✅ PDF generado exitosamente: {pdf_path}")
-        print(f"📄 Tamaño: {os.path.getsize(pdf_path) / 1024:.2f} KB")
-    except Exception as e:
-        print(f"❌ Error al convertir: {e}")
+        print(f"✅ PDF generado exitosamente: {pdf_path}", file=log)
+        print(f"📄 Tamaño: {os.path.getsize(pdf_path) / 1024:.2f} KB", file=log)
+    except (PdfRenderError, OSError, ValueError) as e:
+        print(f"❌ Error: {e}", file=log)
         sys.exit(1)
 
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Uso: python html-to-pdf.py <archivo.html> [archivo-salida.pdf]")
+        print("Uso: python html-to-pdf.py <archivo.html|-> [archivo-salida.pdf|-]")
         print("\nEjemplo:")
         print("  python html-to-pdf.py colonia-directiva-docentes-2026.html")
         print("  python html-to-pdf.py input.html output.pdf")
+        print("  cat input.html | python html-to-pdf.py - - > output.pdf")
         sys.exit(1)
 
     html_file = sys.argv[1]
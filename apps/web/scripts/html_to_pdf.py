@@ -0,0 +1,164 @@
+"""
+Renderizado de HTML a PDF con WeasyPrint, importable y en memoria.
+
+A diferencia de html-to-pdf.py (la CLI), este módulo no toca el disco salvo
+que se le pase una ruta, y reporta los errores con excepciones en lugar de
+terminar el proceso:
+
+    from html_to_pdf import render_pdf
+
+    pdf = render_pdf("<h1>Hola</h1>")              # -> bytes
+    render_pdf(html_bytes, buffer)                 # escribe en un file-like
+    render_pdf(Path("directiva.html"), Path("directiva.pdf"))
+    stream_pdf(sys.stdin.buffer)                   # PDF a stdout para pipes
+
+Fuentes aceptadas:
+    str                   HTML como texto
+    bytes / bytearray     HTML codificado (WeasyPrint detecta el charset)
+    file-like             cualquier objeto con .read()
+    pathlib.Path          archivo HTML en disco
+
+Un `str` siempre es HTML; para leer un archivo hay que pasar un `Path`.
+"""
+
+import io
+import os
+import sys
+from pathlib import Path
+
+__all__ = [
+    'PdfRenderError',
+    'WeasyPrintNotInstalled',
+    'render_document',
+    'render_pdf',
+    'stream_pdf',
+    'convert_file',
+]
+
+
+class PdfRenderError(Exception):
+    """Falló la carga o el renderizado del documento"""
+
+
+class WeasyPrintNotInstalled(PdfRenderError):
+    """WeasyPrint no está disponible en el entorno"""
+
+
+_weasyprint = None
+
+
+def _html_class():
+    # Importación diferida: el módulo se puede importar (y sus errores
+    # capturar) aunque WeasyPrint no esté instalado
+    global _weasyprint
+    if _weasyprint is None:
+        try:
+            import weasyprint
+        except ImportError as e:
+            raise WeasyPrintNotInstalled(
+                "WeasyPrint no está instalado. Instalalo con: pip install weasyprint"
+            ) from e
+        except OSError as e:
+            # Instalado, pero faltan sus librerías del sistema (Pango, etc.)
+            raise WeasyPrintNotInstalled(
+                f"WeasyPrint no puede cargar sus librerías del sistema (Pango): {e}"
+            ) from e
+        _weasyprint = weasyprint
+    return _weasyprint.HTML
+
+
+def _load_html(source, base_url=None):
+    HTML = _html_class()
+    if isinstance(source, str):
+        return HTML(string=source, base_url=base_url)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return HTML(file_obj=io.BytesIO(source), base_url=base_url)
+    if isinstance(source, os.PathLike):
+        path = Path(source)
+        if not path.is_file():
+            raise FileNotFoundError(f"El archivo {path} no existe")
+        return HTML(filename=str(path), base_url=base_url)
+    if hasattr(source, 'read'):
+        return HTML(file_obj=source, base_url=base_url)
+    raise TypeError(
+        f"Fuente HTML no soportada: {type(source).__name__} "
+        "(usar str, bytes, un file-like o pathlib.Path)"
+    )
+
+
+def render_document(source, *, base_url=None, stylesheets=None):
+    """
+    Parsea y maqueta el HTML sin escribir el PDF.
+
+    Útil para inspeccionar el resultado (p. ej. `len(document.pages)`) o
+    escribir el mismo documento varias veces con `document.write_pdf()`.
+
+    Returns:
+        weasyprint.Document: el documento maquetado
+    """
+    try:
+        return _load_html(source, base_url).render(stylesheets=stylesheets)
+    except (OSError, TypeError, PdfRenderError):
+        # Errores de entrada/salida y de uso: se propagan tal cual
+        raise
+    except Exception as e:
+        raise PdfRenderError(f"Error al convertir: {e}") from e
+
+
+def render_pdf(source, target=None, *, base_url=None, stylesheets=None):
+    """
+    Renderiza HTML a PDF.
+
+    Args:
+        source: HTML como str, bytes, file-like o pathlib.Path
+        target: None para devolver los bytes, un file-like con .write()
+            (p. ej. io.BytesIO o sys.stdout.buffer) o un pathlib.Path
+        base_url: base para resolver imágenes y CSS relativos
+            (por defecto, la carpeta del archivo si `source` es un Path)
+        stylesheets: hojas de estilo extra (rutas o weasyprint.CSS)
+
+    Returns:
+        bytes | None: el PDF si no se pasó `target`
+
+    Raises:
+        WeasyPrintNotInstalled: si falta WeasyPrint o sus librerías del sistema
+        FileNotFoundError: si `source` es un Path inexistente
+        TypeError: si `source` no es de un tipo soportado
+        PdfRenderError: si WeasyPrint falla al parsear o renderizar
+    """
+    document = render_document(source, base_url=base_url, stylesheets=stylesheets)
+    if isinstance(target, os.PathLike):
+        target = str(target)
+    try:
+        return document.write_pdf(target)
+    except OSError:
+        raise
+    except Exception as e:
+        raise PdfRenderError(f"Error al escribir el PDF: {e}") from e
+
+
+def stream_pdf(source, stream=None, **kwargs):
+    """
+    Renderiza y escribe el PDF en `stream` (por defecto, stdout binario)
+    para poder encadenarlo con otros comandos.
+    """
+    stream = stream if stream is not None else sys.stdout.buffer
+    render_pdf(source, stream, **kwargs)
+    stream.flush()
+
+
+def convert_file(html_path, pdf_path=None, **kwargs):
+    """
+    Convierte un archivo HTML en disco a PDF.
+
+    Args:
+        html_path: ruta al archivo HTML
+        pdf_path: ruta de salida (por defecto, la misma con extensión .pdf)
+
+    Returns:
+        Path: la ruta del PDF generado
+    """
+    html_path = Path(html_path)
+    pdf_path = Path(pdf_path) if pdf_path is not None else html_path.with_suffix('.pdf')
+    render_pdf(html_path, pdf_path, **kwargs)
+    return pdf_path
@@ -0,0 +1,6 @@
+"""
+Harness de carga y contención para la API de Mateatletas.
+
+Cada módulo es ejecutable desde tests/scripts:
+    python -m harness.contencion
+"""
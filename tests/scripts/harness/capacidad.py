@@ -0,0 +1,203 @@
+"""
+BUSCADOR DE CAPACIDAD POR ENDPOINT
+
+Reemplaza los `arrivalRate` fijos de artillery.yml por una búsqueda de lazo
+cerrado: para cada escenario (o endpoint suelto) sube la tasa paso a paso
+hasta que el p99 o la tasa de error rompen el presupuesto, y después
+bisecta entre el último paso sano y el primero roto.
+
+Reporta por objetivo la máxima tasa sostenible y la rodilla de la curva de
+latencia (el punto donde el p99 empieza a crecer más rápido que la carga),
+ordenados de modo que el módulo que satura primero quede arriba.
+
+Un 429 aborta la búsqueda: el rate limiter es por usuario y el harness usa
+un solo token, así que ese techo sería el de RATE_LIMIT_MAX y no el de la
+API (ver tests/README.md). Otros errores de un objetivo (p. ej. un 401 al
+vencer el token) se registran y se sigue con el siguiente. En ambos casos
+se imprime el resumen de los objetivos completos y se sale con exit 1.
+
+Uso (desde tests/scripts):
+    python -m harness.capacidad
+    python -m harness.capacidad --objetivos eventos clases gamificacion --p99-max 1000
+    python -m harness.capacidad --objetivos "GET /eventos/estadisticas" --duracion-paso 30
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import requests
+
+from . import escenarios
+from .comun import (
+    GREEN, RED, YELLOW, NC,
+    HarnessError, LimiteDeTasaError, auth_headers, login, seccion, titulo, verificar_sin_429,
+)
+from .generador import ejecutar_carga
+
+# Presupuesto por defecto: el `ensure` de artillery.yml
+P99_MAX_MS = 5000
+TASA_ERROR_MAX = 0.01
+# Fracción mínima de la tasa objetivo que debe completarse con éxito
+EFICIENCIA_MIN = 0.95
+
+
+def medir_paso(peticiones, tasa, args, token):
+    fase = ejecutar_carga(peticiones, [(args.duracion_paso, tasa)], args.procesos, args.conexiones, token)[0]
+    verificar_sin_429(fase['estados'], f"el paso de {tasa:.1f} req/s")
+    p99 = fase['histograma'].percentil(99)
+    motivo = None
+    if p99 > args.p99_max:
+        motivo = f"p99 {p99:.0f}ms > {args.p99_max:.0f}ms"
+    elif fase['tasa_error'] > args.error_max:
+        motivo = f"errores {fase['tasa_error'] * 100:.2f}% > {args.error_max * 100:.2f}%"
+    elif fase['rps'] < tasa * EFICIENCIA_MIN:
+        motivo = f"sólo {fase['rps']:.1f} de {tasa:.1f} req/s"
+
+    color = GREEN if motivo is None else RED
+    print(f"  {color}{tasa:>8.1f} req/s{NC}  p99 {p99:>8.1f}ms  errores {fase['tasa_error'] * 100:5.2f}%"
+          + (f"  ✗ {motivo}" if motivo else "  ✓"))
+    return {'tasa': tasa, 'rps': fase['rps'], 'p99': p99, 'tasa_error': fase['tasa_error'],
+            'motivo': motivo, 'por_endpoint': fase['por_endpoint']}
+
+
+def rodilla(puntos):
+    """
+    Rodilla de la curva tasa -> p99: el punto más alejado por debajo de la
+    recta que une el primer y el último punto (curvas normalizadas a [0, 1]).
+
+    Returns:
+        dict | None: el punto de la rodilla, o None con menos de 3 puntos
+    """
+    puntos = sorted(puntos, key=lambda p: p['tasa'])
+    if len(puntos) < 3:
+        return None
+    x0, x1 = puntos[0]['tasa'], puntos[-1]['tasa']
+    y0, y1 = puntos[0]['p99'], puntos[-1]['p99']
+    if x1 == x0 or y1 == y0:
+        return None
+
+    def distancia(p):
+        x = (p['tasa'] - x0) / (x1 - x0)
+        y = (p['p99'] - y0) / (y1 - y0)
+        return x - y
+
+    candidato = max(puntos[1:-1], key=distancia)
+    return candidato if distancia(candidato) > 0 else None
+
+
+def buscar_capacidad(nombre, headers, token, args):
+    seccion(nombre)
+    peticiones = escenarios.resolver(nombre, headers)
+    puntos = []
+
+    # 1. Rampa geométrica hasta romper el presupuesto
+    tasa = args.tasa_inicial
+    sano = None
+    roto = None
+    while tasa <= args.tasa_max:
+        punto = medir_paso(peticiones, tasa, args, token)
+        puntos.append(punto)
+        if punto['motivo']:
+            roto = punto
+            break
+        sano = punto
+        tasa *= args.factor
+        time.sleep(args.pausa)
+
+    # 2. Bisección entre el último paso sano y el primero roto
+    if sano and roto:
+        bajo, alto = sano['tasa'], roto['tasa']
+        for _ in range(args.refinamientos):
+            if alto - bajo < max(1.0, bajo * 0.05):
+                break
+            time.sleep(args.pausa)
+            punto = medir_paso(peticiones, (bajo + alto) / 2, args, token)
+            puntos.append(punto)
+            if punto['motivo']:
+                alto = punto['tasa']
+            else:
+                bajo = punto['tasa']
+                sano = punto
+
+    return {
+        'objetivo': nombre,
+        'capacidad': sano['rps'] if sano else 0.0,
+        'sano': sano,
+        'limite': roto['motivo'] if roto else f"no se alcanzó con {args.tasa_max:.0f} req/s",
+        'rodilla': rodilla(puntos),
+        'puntos': puntos,
+    }
+
+
+def imprimir_resumen(resultados):
+    seccion("CAPACIDAD SOSTENIBLE (menor primero)")
+    if not resultados:
+        print(f"  {YELLOW}Ningún objetivo completó la búsqueda{NC}\n")
+        return
+    for r in sorted(resultados, key=lambda r: r['capacidad']):
+        rodilla_txt = (f"rodilla ~{r['rodilla']['tasa']:.1f} req/s (p99 {r['rodilla']['p99']:.0f}ms)"
+                       if r['rodilla'] else "rodilla: sin datos suficientes")
+        color = YELLOW if r is min(resultados, key=lambda x: x['capacidad']) else GREEN
+        print(f"  {color}{r['objetivo']:<36}{NC} {r['capacidad']:>8.1f} req/s  | {rodilla_txt}")
+        print(f"  {'':<36} límite: {r['limite']}")
+        if r['sano'] and len(r['sano']['por_endpoint']) > 1:
+            for endpoint, h in sorted(r['sano']['por_endpoint'].items(),
+                                      key=lambda item: -item[1].percentil(99)):
+                print(f"      {endpoint:<40} p99 {h.percentil(99):>8.1f}ms")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Búsqueda de capacidad sostenible por endpoint")
+    parser.add_argument("--objetivos", nargs="+", default=["eventos", "clases", "gamificacion"],
+                        help="Escenarios de harness/escenarios.py o endpoints \"GET /ruta\"")
+    parser.add_argument("--p99-max", type=float, default=P99_MAX_MS, help="Presupuesto de p99 (ms)")
+    parser.add_argument("--error-max", type=float, default=TASA_ERROR_MAX, help="Tasa de error máxima (0-1)")
+    parser.add_argument("--tasa-inicial", type=float, default=5.0)
+    parser.add_argument("--tasa-max", type=float, default=5000.0)
+    parser.add_argument("--factor", type=float, default=1.5, help="Multiplicador de la rampa")
+    parser.add_argument("--refinamientos", type=int, default=3, help="Pasos de bisección")
+    parser.add_argument("--duracion-paso", type=float, default=20.0, help="Segundos por paso")
+    parser.add_argument("--pausa", type=float, default=5.0, help="Enfriamiento entre pasos")
+    parser.add_argument("--procesos", type=int, default=os.cpu_count())
+    parser.add_argument("--conexiones", type=int, default=64)
+    args = parser.parse_args()
+
+    titulo("BÚSQUEDA DE CAPACIDAD")
+
+    try:
+        token, _ = login()
+    except (HarnessError, requests.RequestException) as e:
+        print(f"{RED}✗ {e}{NC}")
+        sys.exit(1)
+    headers = auth_headers(token)
+
+    resultados = []
+    fallas = []
+    for n, objetivo in enumerate(args.objetivos):
+        try:
+            resultados.append(buscar_capacidad(objetivo, headers, token, args))
+            print()
+        except LimiteDeTasaError as e:
+            # Los objetivos que siguen chocarían con el mismo limiter
+            print(f"\n  {RED}✗ {e}{NC}\n")
+            fallas.append(f"{objetivo}: {e}")
+            fallas.extend(f"{o}: no se midió (búsqueda abortada por 429)" for o in args.objetivos[n + 1:])
+            break
+        except (HarnessError, requests.RequestException) as e:
+            print(f"\n  {RED}✗ {e}{NC}\n")
+            fallas.append(f"{objetivo}: {e}")
+
+    imprimir_resumen(resultados)
+    if fallas:
+        print(f"{RED}OBJETIVOS SIN MEDIR:{NC}\n")
+        for falla in fallas:
+            print(f"  {RED}✗{NC} {falla}")
+        print()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Utilidades compartidas por los escenarios del harness:
+configuración, colores de consola, login y estadísticas de latencia.
+"""
+
+import math
+import os
+
+import requests
+
+BASE_URL = os.environ.get("API_URL", "http://localhost:3001/api")
+
+DOCENTE_EMAIL = os.environ.get("DOCENTE_EMAIL", "docente@test.com")
+DOCENTE_PASSWORD = os.environ.get("DOCENTE_PASSWORD", "Test123!")
+
+# Colores
+GREEN = '\033[0;32m'
+RED = '\033[0;31m'
+YELLOW = '\033[1;33m'
+BLUE = '\033[0;34m'
+CYAN = '\033[0;36m'
+NC = '\033[0m'
+
+
+class HarnessError(Exception):
+    """Error de preparación del escenario (login, datos faltantes, etc.)"""
+
+
+class LimiteDeTasaError(HarnessError):
+    """La API respondió 429: lo medido es el rate limiter, no la API"""
+
+
+def verificar_sin_429(estados, contexto):
+    """
+    Aborta si hubo respuestas 429. UserThrottlerGuard limita por usuario y
+    el harness usa un solo token, así que cualquier 429 significa que se
+    midió RATE_LIMIT_MAX y no la capacidad del endpoint.
+
+    Args:
+        estados: dict/Counter de código de estado (str) -> cantidad
+        contexto: descripción de la medición para el mensaje
+
+    Raises:
+        LimiteDeTasaError: si hay al menos un 429
+    """
+    cantidad = estados.get('429', 0)
+    if cantidad:
+        raise LimiteDeTasaError(
+            f"{cantidad} respuestas 429 en {contexto}: el rate limiter por usuario "
+            f"(RATE_LIMIT_MAX, 1000 req/min por defecto en desarrollo) cortó antes que la API. "
+            f"Subir RATE_LIMIT_MAX y reiniciar la API (ver tests/README.md)"
+        )
+
+
+def login(email=DOCENTE_EMAIL, password=DOCENTE_PASSWORD):
+    """
+    Autentica contra /auth/login.
+
+    Returns:
+        tuple: (token, user)
+    """
+    r = requests.post(f"{BASE_URL}/auth/login", json={"email": email, "password": password})
+    if r.status_code != 200:
+        raise HarnessError(f"Login falló: HTTP {r.status_code}: {r.text[:200]}")
+    data = r.json()
+    if 'access_token' not in data:
+        raise HarnessError("Respuesta de login sin access_token")
+    return data['access_token'], data.get('user', {})
+
+
+def auth_headers(token):
+    return {'Authorization': f'Bearer {token}'}
+
+
+def percentil(valores, p):
+    """Percentil `p` (0-100) por rango más cercano sobre una lista de valores"""
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    rango = max(1, math.ceil(p / 100 * len(ordenados)))
+    return ordenados[rango - 1]
+
+
+def titulo(texto):
+    print(f"{BLUE}{'='*60}{NC}")
+    print(f"{BLUE}  {texto}{NC}")
+    print(f"{BLUE}{'='*60}{NC}\n")
+
+
+def seccion(texto):
+    print(f"{CYAN}═══ {texto} {'═' * max(0, 54 - len(texto))}{NC}\n")
@@ -0,0 +1,324 @@
+"""
+ESCENARIO DE CONTENCIÓN - ASISTENCIA Y GAMIFICACIÓN
+
+Simula el cierre de clase: muchos docentes escribiendo a la vez sobre la
+misma clase y el mismo estudiante.
+
+    POST /asistencia/clases/:claseId/estudiantes/:estudianteId
+    POST /gamificacion/puntos
+
+Por cada nivel de concurrencia dispara rondas de escrituras simultáneas
+(todas liberadas por una barrera), mide throughput y latencias de cola y
+verifica el estado final:
+    - una sola asistencia para (clase, estudiante)
+    - el XP total aumentó exactamente la suma de los puntos otorgados
+
+marcarAsistencia hace findFirst y después create o update, así que la
+carrera está en la creación. Cada nivel de asistencia usa un estudiante
+distinto que todavía no tiene asistencia en la clase (los niveles más
+altos primero), para que la primera ráfaga compita por el create. Como el
+roster deduplica por estudiante, los duplicados se detectan por los ids
+distintos que devuelven las respuestas.
+
+Un nivel sin escrituras exitosas, con respuestas no-2xx o (en asistencia)
+sin pasar por la creación no prueba nada y se reporta como no concluyente
+(exit 1). Un 429 aborta la corrida: es el rate limiter por usuario, no
+contención (subir RATE_LIMIT_MAX).
+
+Uso (desde tests/scripts):
+    python -m harness.contencion
+    python -m harness.contencion --concurrencias 1 4 16 64 --rondas 10
+    python -m harness.contencion --clase-id <id> --estudiante-id <id>
+
+--estudiante-id fija el estudiante de gamificación; los de asistencia
+salen siempre del roster de la clase.
+"""
+
+import argparse
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from .comun import (
+    BASE_URL, GREEN, RED, YELLOW, NC,
+    HarnessError, LimiteDeTasaError, auth_headers, login, percentil, seccion, titulo,
+    verificar_sin_429,
+)
+
+TIPO_ACCION = "PARTICIPACION"
+
+
+def roster(headers, clase_id):
+    r = requests.get(f"{BASE_URL}/asistencia/clases/{clase_id}", headers=headers)
+    r.raise_for_status()
+    return r.json().get('lista', [])
+
+
+def sin_asistencia(lista):
+    return [item['estudiante']['id'] for item in lista if not item['asistencia_id']]
+
+
+def descubrir_objetivo(headers):
+    """
+    Busca la clase del docente con más estudiantes inscriptos que todavía
+    no tienen asistencia (cada uno permite probar la carrera de creación
+    en un nivel).
+
+    Returns:
+        tuple: (clase_id, lista) con el roster de la clase
+    """
+    r = requests.get(f"{BASE_URL}/clases/docente/mis-clases", headers=headers)
+    if r.status_code != 200:
+        raise HarnessError(f"GET /clases/docente/mis-clases: HTTP {r.status_code}")
+
+    mejor = None
+    for clase in r.json():
+        try:
+            lista = roster(headers, clase['id'])
+        except requests.RequestException:
+            continue
+        if lista and (mejor is None or len(sin_asistencia(lista)) > len(sin_asistencia(mejor[1]))):
+            mejor = (clase['id'], lista)
+
+    if mejor is None:
+        raise HarnessError("El docente no tiene clases con estudiantes inscriptos "
+                           "(usar --clase-id y --estudiante-id)")
+    return mejor
+
+
+def asignar_estudiantes(concurrencias, libres, por_defecto):
+    """
+    Un estudiante sin asistencia por nivel, empezando por la concurrencia
+    más alta; los niveles que no alcanzan usan `por_defecto`.
+
+    Returns:
+        list: estudiante_id por posición de `concurrencias`
+    """
+    asignados = [por_defecto] * len(concurrencias)
+    orden = sorted(range(len(concurrencias)), key=lambda i: concurrencias[i], reverse=True)
+    for i, estudiante_id in zip(orden, libres):
+        asignados[i] = estudiante_id
+    return asignados
+
+
+def asistencias_en_roster(headers, clase_id, estudiante_id):
+    return [
+        item['asistencia_id'] for item in roster(headers, clase_id)
+        if item['estudiante']['id'] == estudiante_id and item['asistencia_id']
+    ]
+
+
+def xp_total(headers, estudiante_id):
+    r = requests.get(f"{BASE_URL}/gamificacion/puntos/{estudiante_id}", headers=headers)
+    r.raise_for_status()
+    return r.json()['total']
+
+
+def disparar(concurrencia, rondas, hacer_request):
+    """
+    Ejecuta `rondas` ráfagas de `concurrencia` requests simultáneos.
+
+    Args:
+        hacer_request: función (session, ronda, hilo) -> requests.Response
+
+    Returns:
+        dict con latencias (ms), respuestas y duración total
+    """
+    barrera = threading.Barrier(concurrencia)
+    sesiones = threading.local()
+    resultados = []
+    lock = threading.Lock()
+
+    def worker(hilo):
+        if not hasattr(sesiones, 'session'):
+            sesiones.session = requests.Session()
+        for ronda in range(rondas):
+            barrera.wait()
+            inicio = time.perf_counter()
+            try:
+                r = hacer_request(sesiones.session, ronda, hilo)
+                status, cuerpo = r.status_code, (r.json() if r.content else None)
+            except (requests.RequestException, ValueError) as e:
+                status, cuerpo = None, str(e)
+            ms = (time.perf_counter() - inicio) * 1000
+            with lock:
+                resultados.append((ms, status, cuerpo))
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrencia) as pool:
+        list(pool.map(worker, range(concurrencia)))
+    duracion = time.perf_counter() - inicio
+
+    return {'resultados': resultados, 'duracion': duracion}
+
+
+def resumir(nombre, concurrencia, corrida):
+    resultados = corrida['resultados']
+    latencias = [ms for ms, _, _ in resultados]
+    ok = [r for r in resultados if r[1] is not None and 200 <= r[1] < 300]
+    errores = Counter('conexion' if status is None else str(status)
+                      for _, status, _ in resultados if status is None or status >= 300)
+    resumen = {
+        'escenario': nombre,
+        'concurrencia': concurrencia,
+        'requests': len(resultados),
+        'exitosos': len(ok),
+        'rps': len(ok) / corrida['duracion'] if corrida['duracion'] else 0.0,
+        'p50': percentil(latencias, 50),
+        'p95': percentil(latencias, 95),
+        'p99': percentil(latencias, 99),
+        'max': max(latencias, default=0.0),
+        'errores': dict(errores),
+        # Sin escrituras exitosas, o con rechazos, el estado final no prueba nada
+        'concluyente': bool(ok) and not errores,
+    }
+    verificar_sin_429(errores, f"{nombre} c={concurrencia}")
+    color = GREEN if not errores else YELLOW
+    print(f"  {color}c={concurrencia:<4}{NC} "
+          f"{resumen['rps']:>8.1f} req/s  "
+          f"p50 {resumen['p50']:>7.1f}ms  p95 {resumen['p95']:>7.1f}ms  "
+          f"p99 {resumen['p99']:>7.1f}ms  max {resumen['max']:>7.1f}ms"
+          + (f"  errores {dict(errores)}" if errores else ""))
+    return resumen
+
+
+def contencion_asistencia(headers, clase_id, estudiante_id, concurrencia, rondas):
+    url = f"{BASE_URL}/asistencia/clases/{clase_id}/estudiantes/{estudiante_id}"
+    # Sin asistencia previa, la primera ráfaga compite por el create
+    creacion = not asistencias_en_roster(headers, clase_id, estudiante_id)
+
+    def hacer_request(session, ronda, hilo):
+        return session.post(url, headers=headers, json={
+            "estado": "Presente",
+            "observaciones": f"contencion c={concurrencia} r={ronda} h={hilo}",
+        })
+
+    corrida = disparar(concurrencia, rondas, hacer_request)
+    resumen = resumir("asistencia", concurrencia, corrida)
+    print(f"         └─ {'creación concurrente + actualización' if creacion else 'sólo actualización (ya tenía asistencia)'}")
+
+    # Todas las respuestas exitosas deben referirse al mismo registro
+    ids = {cuerpo['id'] for _, status, cuerpo in corrida['resultados']
+           if status is not None and 200 <= status < 300 and isinstance(cuerpo, dict) and 'id' in cuerpo}
+    roster = asistencias_en_roster(headers, clase_id, estudiante_id)
+    ids.update(roster)
+    resumen['asistencias_distintas'] = len(ids)
+    resumen['consistente'] = len(ids) <= 1
+    resumen['creacion'] = creacion
+    resumen['concluyente'] = resumen['concluyente'] and creacion
+    return resumen
+
+
+def contencion_xp(headers, clase_id, estudiante_id, concurrencia, rondas):
+    url = f"{BASE_URL}/gamificacion/puntos"
+    antes = xp_total(headers, estudiante_id)
+
+    def hacer_request(session, ronda, hilo):
+        return session.post(url, headers=headers, json={
+            "estudianteId": estudiante_id,
+            "tipoAccion": TIPO_ACCION,
+            "claseId": clase_id,
+            "contexto": f"contencion c={concurrencia} r={ronda} h={hilo}",
+        })
+
+    corrida = disparar(concurrencia, rondas, hacer_request)
+    resumen = resumir("gamificacion", concurrencia, corrida)
+
+    otorgados = sum(
+        cuerpo['puntoObtenido']['puntos'] for _, status, cuerpo in corrida['resultados']
+        if status is not None and 200 <= status < 300 and isinstance(cuerpo, dict) and 'puntoObtenido' in cuerpo
+    )
+    despues = xp_total(headers, estudiante_id)
+    resumen['xp_esperado'] = otorgados
+    resumen['xp_real'] = despues - antes
+    resumen['consistente'] = despues - antes == otorgados
+    return resumen
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Contención de escrituras en asistencia y gamificación")
+    parser.add_argument("--concurrencias", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--rondas", type=int, default=5, help="Ráfagas simultáneas por nivel")
+    parser.add_argument("--clase-id")
+    parser.add_argument("--estudiante-id")
+    args = parser.parse_args()
+
+    titulo("CONTENCIÓN - ASISTENCIA Y GAMIFICACIÓN")
+
+    try:
+        token, _ = login()
+        headers = auth_headers(token)
+        if args.clase_id:
+            clase_id, lista = args.clase_id, roster(headers, args.clase_id)
+        else:
+            clase_id, lista = descubrir_objetivo(headers)
+        if not lista:
+            raise HarnessError(f"La clase {clase_id} no tiene estudiantes inscriptos")
+    except (HarnessError, requests.RequestException) as e:
+        print(f"{RED}✗ {e}{NC}")
+        sys.exit(1)
+
+    estudiante_id = args.estudiante_id or lista[0]['estudiante']['id']
+    libres = sin_asistencia(lista)
+    estudiantes_asistencia = asignar_estudiantes(args.concurrencias, libres, estudiante_id)
+    print(f"Clase: {clase_id} | Estudiante (gamificación): {estudiante_id} | "
+          f"sin asistencia: {len(libres)}/{len(args.concurrencias)} niveles\n")
+    if len(libres) < len(args.concurrencias):
+        print(f"{YELLOW}⚠ No hay estudiantes sin asistencia para todos los niveles: "
+              f"los de menor concurrencia sólo prueban la actualización{NC}\n")
+
+    inconsistencias = []
+    inconclusos = []
+
+    def no_concluyente(r):
+        if r.get('creacion') is False:
+            return (f"{r['escenario']} c={r['concurrencia']}: el estudiante ya tenía asistencia, "
+                    f"no se probó la creación concurrente")
+        return (f"{r['escenario']} c={r['concurrencia']}: {r['exitosos']}/{r['requests']} exitosos"
+                + (f", errores {r['errores']}" if r['errores'] else ""))
+
+    try:
+        seccion("POST /asistencia/clases/:id/estudiantes/:id")
+        for c, estudiante_asistencia in zip(args.concurrencias, estudiantes_asistencia):
+            r = contencion_asistencia(headers, clase_id, estudiante_asistencia, c, args.rondas)
+            if not r['consistente']:
+                inconsistencias.append(f"asistencia c={c}: {r['asistencias_distintas']} registros para el mismo estudiante")
+            elif not r['concluyente']:
+                inconclusos.append(no_concluyente(r))
+        print()
+
+        seccion("POST /gamificacion/puntos")
+        for c in args.concurrencias:
+            r = contencion_xp(headers, clase_id, estudiante_id, c, args.rondas)
+            if not r['consistente']:
+                inconsistencias.append(f"gamificacion c={c}: XP esperado {r['xp_esperado']}, real {r['xp_real']}")
+            elif not r['concluyente']:
+                inconclusos.append(no_concluyente(r))
+        print()
+    except LimiteDeTasaError as e:
+        print(f"\n{RED}✗ {e}{NC}\n")
+        sys.exit(1)
+
+    if inconsistencias:
+        print(f"{RED}ESTADO FINAL INCONSISTENTE:{NC}\n")
+        for linea in inconsistencias:
+            print(f"  {RED}✗{NC} {linea}")
+        print()
+        sys.exit(1)
+
+    if inconclusos:
+        print(f"{YELLOW}RESULTADO NO CONCLUYENTE:{NC}\n")
+        for linea in inconclusos:
+            print(f"  {YELLOW}⚠{NC} {linea}")
+        print()
+        sys.exit(1)
+
+    print(f"{GREEN}✓ Sin asistencias duplicadas y XP consistente en todos los niveles{NC}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Escenarios de lectura tomados de la suite del portal docente
+(test-backend-portal-docente.py), agrupados por módulo.
+
+Las rutas pueden usar `{estudiante_id}`; el valor se resuelve una vez con
+GET /estudiantes antes de generar carga.
+"""
+
+import requests
+
+from .comun import BASE_URL, HarnessError
+
+ESCENARIOS = {
+    'health': [
+        ('GET', '/health'),
+    ],
+    'docentes': [
+        ('GET', '/docentes/me'),
+    ],
+    'estudiantes': [
+        ('GET', '/estudiantes'),
+    ],
+    'clases': [
+        ('GET', '/clases/docente/mis-clases'),
+    ],
+    'eventos': [
+        ('GET', '/eventos'),
+        ('GET', '/eventos/vista-agenda'),
+        ('GET', '/eventos/vista-semana'),
+        ('GET', '/eventos/estadisticas'),
+    ],
+    'gamificacion': [
+        ('GET', '/gamificacion/acciones'),
+        ('GET', '/gamificacion/puntos/{estudiante_id}'),
+        ('GET', '/gamificacion/logros/{estudiante_id}'),
+    ],
+    'catalogo': [
+        ('GET', '/productos'),
+    ],
+    'notificaciones': [
+        ('GET', '/notificaciones'),
+    ],
+}
+
+ESCENARIOS['portal'] = [
+    peticion for nombre, peticiones in ESCENARIOS.items() if nombre != 'health'
+    for peticion in peticiones
+]
+
+
+def resolver(nombre, headers):
+    """
+    Devuelve las peticiones del escenario (o de un endpoint suelto
+    "GET /ruta") con los parámetros de ruta resueltos.
+
+    Returns:
+        list: [(metodo, ruta)]
+    """
+    if nombre in ESCENARIOS:
+        peticiones = ESCENARIOS[nombre]
+    elif ' ' in nombre:
+        metodo, ruta = nombre.split(' ', 1)
+        peticiones = [(metodo.upper(), ruta)]
+    else:
+        raise HarnessError(f"Escenario desconocido: {nombre} (disponibles: {', '.join(ESCENARIOS)})")
+
+    valores = {}
+    if any('{estudiante_id}' in ruta for _, ruta in peticiones):
+        r = requests.get(f"{BASE_URL}/estudiantes", headers=headers)
+        if r.status_code != 200 or not r.json():
+            raise HarnessError("No hay estudiantes para resolver {estudiante_id}")
+        valores['estudiante_id'] = r.json()[0]['id']
+
+    return [(metodo, ruta.format(**valores)) for metodo, ruta in peticiones]
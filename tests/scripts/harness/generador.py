@@ -0,0 +1,276 @@
+"""
+GENERADOR DE CARGA MULTI-PROCESO
+
+Un solo proceso Python satura un core (GIL) mucho antes que la API. El
+coordinador reparte la tasa de llegada objetivo entre varios procesos
+worker, sincroniza el inicio de cada fase con una barrera y combina los
+histogramas de latencia (estilo HDR) de todos los workers en un único
+reporte.
+
+La carga es de lazo abierto: cada request tiene un instante previsto según
+la tasa y la latencia se mide desde ese instante, no desde que salió. Así,
+si la API (o el cliente) se atrasa, la espera queda registrada en lugar de
+esconderse (omisión coordinada).
+
+Los 429 se cuentan aparte: el rate limiter es por usuario y todos los
+workers comparten un token, así que un 429 aborta la corrida en lugar de
+reportarse como saturación (subir RATE_LIMIT_MAX, ver tests/README.md).
+El primer 429 detiene a todos los workers en el acto; no se siguen
+mandando fases contra el limiter.
+
+Uso (desde tests/scripts):
+    python -m harness.generador --escenario portal --fase 30:50 --fase 120:200
+    python -m harness.generador --escenario "GET /eventos/estadisticas" --procesos 8
+    python -m harness.generador --escenario health --sin-auth --fase 60:500
+"""
+
+import argparse
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from threading import BrokenBarrierError
+
+import requests
+
+from . import escenarios
+from .comun import (
+    BASE_URL, GREEN, RED, YELLOW, NC,
+    HarnessError, LimiteDeTasaError, auth_headers, login, seccion, titulo,
+    verificar_sin_429,
+)
+from .histograma import Histograma
+
+# Margen entre la liberación de la barrera y el inicio de la fase
+MARGEN_INICIO = 0.2
+TIMEOUT_REQUEST = 30
+
+
+def _worker(indice, procesos, token, peticiones, fases, conexiones, barrera, inicio_fase, cola, detener):
+    headers = auth_headers(token) if token else {}
+    sesiones = threading.local()
+
+    for n_fase, (duracion, tasa) in enumerate(fases):
+        if detener.is_set():
+            return
+        # Dos esperas: todos listos -> el coordinador fija el inicio -> todos arrancan
+        try:
+            barrera.wait()
+            barrera.wait()
+        except BrokenBarrierError:
+            # El coordinador cortó la corrida
+            return
+        inicio = inicio_fase.value
+
+        histogramas = {}
+        estados = Counter()
+        lock = threading.Lock()
+        atraso_max = 0.0
+        enviados = 0
+
+        def ejecutar(previsto, metodo, ruta):
+            if not hasattr(sesiones, 'session'):
+                sesiones.session = requests.Session()
+            try:
+                r = sesiones.session.request(metodo, f"{BASE_URL}{ruta}", headers=headers,
+                                             timeout=TIMEOUT_REQUEST)
+                estado = str(r.status_code)
+            except requests.RequestException:
+                estado = 'conexion'
+            if estado == '429':
+                detener.set()
+            ms = (time.time() - previsto) * 1000
+            nombre = f"{metodo} {ruta}"
+            with lock:
+                if nombre not in histogramas:
+                    histogramas[nombre] = Histograma()
+                histogramas[nombre].registrar(ms)
+                estados[estado] += 1
+
+        if tasa > 0:
+            intervalo = procesos / tasa
+            # Los workers se intercalan para que las llegadas queden parejas
+            desfase = indice / tasa
+            with ThreadPoolExecutor(max_workers=conexiones) as pool:
+                k = 0
+                while not detener.is_set():
+                    previsto = inicio + desfase + k * intervalo
+                    if previsto >= inicio + duracion:
+                        break
+                    espera = previsto - time.time()
+                    if espera > 0:
+                        time.sleep(espera)
+                    else:
+                        atraso_max = max(atraso_max, -espera)
+                    metodo, ruta = peticiones[(k * procesos + indice) % len(peticiones)]
+                    pool.submit(ejecutar, previsto, metodo, ruta)
+                    enviados += 1
+                    k += 1
+
+        cola.put({
+            'fase': n_fase,
+            'worker': indice,
+            'enviados': enviados,
+            'estados': dict(estados),
+            'atraso_max_ms': atraso_max * 1000,
+            'histogramas': {nombre: h.a_dict() for nombre, h in histogramas.items()},
+        })
+
+
+def ejecutar_carga(peticiones, fases, procesos=None, conexiones=32, token=None):
+    """
+    Genera carga con varios procesos y devuelve un reporte por fase.
+
+    Args:
+        peticiones: [(metodo, ruta)] que se reparten en round-robin
+        fases: [(duracion_seg, tasa_total_rps)]
+        procesos: cantidad de workers (por defecto, un core cada uno)
+        conexiones: requests concurrentes máximos por worker
+        token: JWT opcional
+
+    Returns:
+        list: un dict por fase con enviados, estados, histograma total y por
+            endpoint. Si hubo un 429 la corrida se corta y sólo incluye las
+            fases ejecutadas hasta ese momento.
+    """
+    procesos = procesos or os.cpu_count()
+    barrera = multiprocessing.Barrier(procesos + 1)
+    inicio_fase = multiprocessing.Value('d', 0.0)
+    cola = multiprocessing.Queue()
+    detener = multiprocessing.Event()
+
+    workers = [
+        multiprocessing.Process(
+            target=_worker,
+            args=(i, procesos, token, peticiones, fases, conexiones, barrera, inicio_fase, cola, detener),
+            daemon=True,
+        )
+        for i in range(procesos)
+    ]
+    for w in workers:
+        w.start()
+
+    mensajes = []
+    fases_ejecutadas = 0
+    try:
+        espera_max = 60.0
+        for n_fase, (duracion, _) in enumerate(fases):
+            barrera.wait(timeout=espera_max)
+            inicio_fase.value = time.time() + MARGEN_INICIO
+            barrera.wait(timeout=espera_max)
+            espera_max = duracion + TIMEOUT_REQUEST + 60.0
+            for _ in range(procesos):
+                try:
+                    mensajes.append(cola.get(timeout=espera_max))
+                except queue.Empty:
+                    raise HarnessError(f"Un worker no reportó la fase {n_fase + 1} "
+                                       f"en {espera_max:.0f}s (¿murió el proceso?)")
+            fases_ejecutadas += 1
+            if detener.is_set():
+                # Un 429: los workers que ya esperan la próxima fase se liberan
+                barrera.abort()
+                break
+    except BrokenBarrierError:
+        raise HarnessError("Un worker no llegó a la barrera de inicio de fase")
+    finally:
+        for w in workers:
+            w.join(timeout=5)
+            if w.is_alive():
+                w.terminate()
+
+    reporte = []
+    for n_fase, (duracion, tasa) in enumerate(fases[:fases_ejecutadas]):
+        fase = {
+            'duracion': duracion,
+            'tasa': tasa,
+            'enviados': 0,
+            'estados': Counter(),
+            'atraso_max_ms': 0.0,
+            'histograma': Histograma(),
+            'por_endpoint': {},
+        }
+        for m in (m for m in mensajes if m['fase'] == n_fase):
+            fase['enviados'] += m['enviados']
+            fase['estados'].update(m['estados'])
+            fase['atraso_max_ms'] = max(fase['atraso_max_ms'], m['atraso_max_ms'])
+            for nombre, datos in m['histogramas'].items():
+                h = Histograma.desde_dict(datos)
+                fase['histograma'].combinar(h)
+                fase['por_endpoint'].setdefault(nombre, Histograma()).combinar(h)
+        exitosos = sum(n for estado, n in fase['estados'].items() if estado.startswith('2'))
+        fase['exitosos'] = exitosos
+        fase['limitados'] = fase['estados'].get('429', 0)
+        fase['errores'] = {e: n for e, n in fase['estados'].items() if not e.startswith('2') and e != '429'}
+        fase['tasa_error'] = (fase['enviados'] - exitosos) / fase['enviados'] if fase['enviados'] else 0.0
+        fase['rps'] = exitosos / duracion if duracion else 0.0
+        reporte.append(fase)
+    return reporte
+
+
+def _linea_latencias(h):
+    return (f"p50 {h.percentil(50):>7.1f}ms  p90 {h.percentil(90):>7.1f}ms  "
+            f"p99 {h.percentil(99):>7.1f}ms  p99.9 {h.percentil(99.9):>7.1f}ms  max {h.maximo:>7.1f}ms")
+
+
+def imprimir_reporte(reporte):
+    for n, fase in enumerate(reporte, 1):
+        seccion(f"FASE {n}: {fase['duracion']}s a {fase['tasa']} req/s")
+        color = GREEN if not fase['errores'] and not fase['limitados'] else YELLOW
+        print(f"  {color}{fase['rps']:.1f} req/s exitosos{NC} | enviados {fase['enviados']} | "
+              f"errores {fase['tasa_error'] * 100:.2f}% {fase['errores'] or ''}")
+        if fase['limitados']:
+            print(f"  {RED}{fase['limitados']} respuestas 429 (rate limiter, no la API){NC}")
+        print(f"  {_linea_latencias(fase['histograma'])}\n")
+        for nombre in sorted(fase['por_endpoint']):
+            h = fase['por_endpoint'][nombre]
+            print(f"  {nombre:<42} n={h.total:<7} p50 {h.percentil(50):>7.1f}ms  "
+                  f"p99 {h.percentil(99):>7.1f}ms")
+        if fase['atraso_max_ms'] > 50:
+            print(f"\n  {YELLOW}⚠ El generador se atrasó hasta {fase['atraso_max_ms']:.0f}ms: "
+                  f"agregar --procesos o --conexiones{NC}")
+        print()
+
+
+def parsear_fase(texto):
+    """'DURACION:TASA' -> (duracion, tasa)"""
+    duracion, tasa = texto.split(':')
+    return float(duracion), float(tasa)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generador de carga multi-proceso")
+    parser.add_argument("--escenario", default="portal",
+                        help=f"{', '.join(escenarios.ESCENARIOS)} o un endpoint suelto \"GET /ruta\"")
+    parser.add_argument("--fase", type=parsear_fase, action="append", metavar="DURACION:TASA",
+                        help="Se puede repetir (por defecto 30:20)")
+    parser.add_argument("--procesos", type=int, default=os.cpu_count())
+    parser.add_argument("--conexiones", type=int, default=32, help="Requests en vuelo por proceso")
+    parser.add_argument("--sin-auth", action="store_true", help="No loguearse (p. ej. para /health)")
+    args = parser.parse_args()
+
+    fases = args.fase or [(30.0, 20.0)]
+    titulo(f"CARGA - {args.escenario} ({args.procesos} procesos)")
+
+    try:
+        token = None if args.sin_auth else login()[0]
+        peticiones = escenarios.resolver(args.escenario, auth_headers(token) if token else {})
+        reporte = ejecutar_carga(peticiones, fases, args.procesos, args.conexiones, token)
+        for n, fase in enumerate(reporte, 1):
+            verificar_sin_429(fase['estados'], f"la fase {n}")
+    except LimiteDeTasaError as e:
+        imprimir_reporte(reporte)
+        print(f"{RED}✗ {e}{NC}")
+        sys.exit(1)
+    except (HarnessError, requests.RequestException) as e:
+        print(f"{RED}✗ {e}{NC}")
+        sys.exit(1)
+
+    imprimir_reporte(reporte)
+
+
+if __name__ == "__main__":
+    main()
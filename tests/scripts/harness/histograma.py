@@ -0,0 +1,98 @@
+"""
+Histograma de latencias estilo HDR (log-lineal), compacto y combinable.
+
+Cada valor (en microsegundos) se agrupa en un bucket cuyo ancho crece con
+la magnitud, manteniendo un error relativo acotado por `bits_precision`
+(7 bits ≈ 1%). Los buckets se guardan en un dict disperso, así un
+histograma de millones de muestras ocupa unos pocos KB y se puede enviar
+entre procesos y sumar sin perder precisión en los percentiles.
+"""
+
+BITS_PRECISION = 7
+
+
+class Histograma:
+    def __init__(self, bits_precision=BITS_PRECISION):
+        self.bits_precision = bits_precision
+        self.buckets = {}
+        self.total = 0
+        self.suma_us = 0
+        self.minimo_us = None
+        self.maximo_us = None
+
+    def _clave(self, valor_us):
+        desplazamiento = max(0, valor_us.bit_length() - self.bits_precision)
+        return (valor_us >> desplazamiento) << desplazamiento, desplazamiento
+
+    def registrar(self, ms):
+        """Registra una latencia en milisegundos"""
+        valor_us = max(0, int(ms * 1000))
+        clave, _ = self._clave(valor_us)
+        self.buckets[clave] = self.buckets.get(clave, 0) + 1
+        self.total += 1
+        self.suma_us += valor_us
+        if self.minimo_us is None or valor_us < self.minimo_us:
+            self.minimo_us = valor_us
+        if self.maximo_us is None or valor_us > self.maximo_us:
+            self.maximo_us = valor_us
+
+    def combinar(self, otro):
+        """Suma otro histograma (de otro worker) sobre este"""
+        if otro.bits_precision != self.bits_precision:
+            raise ValueError("No se pueden combinar histogramas con distinta precisión")
+        for clave, cantidad in otro.buckets.items():
+            self.buckets[clave] = self.buckets.get(clave, 0) + cantidad
+        self.total += otro.total
+        self.suma_us += otro.suma_us
+        if otro.minimo_us is not None:
+            self.minimo_us = otro.minimo_us if self.minimo_us is None else min(self.minimo_us, otro.minimo_us)
+        if otro.maximo_us is not None:
+            self.maximo_us = otro.maximo_us if self.maximo_us is None else max(self.maximo_us, otro.maximo_us)
+        return self
+
+    def percentil(self, p):
+        """Percentil `p` (0-100) en milisegundos"""
+        if not self.total:
+            return 0.0
+        objetivo = max(1, -(-p * self.total // 100))
+        acumulado = 0
+        for clave in sorted(self.buckets):
+            acumulado += self.buckets[clave]
+            if acumulado >= objetivo:
+                _, desplazamiento = self._clave(clave)
+                # Punto medio del bucket, acotado por el máximo observado
+                valor_us = min(clave + ((1 << desplazamiento) >> 1), self.maximo_us)
+                return valor_us / 1000
+        return self.maximo_us / 1000
+
+    @property
+    def media(self):
+        return self.suma_us / self.total / 1000 if self.total else 0.0
+
+    @property
+    def minimo(self):
+        return (self.minimo_us or 0) / 1000
+
+    @property
+    def maximo(self):
+        return (self.maximo_us or 0) / 1000
+
+    def a_dict(self):
+        return {
+            'bits_precision': self.bits_precision,
+            'buckets': self.buckets,
+            'total': self.total,
+            'suma_us': self.suma_us,
+            'minimo_us': self.minimo_us,
+            'maximo_us': self.maximo_us,
+        }
+
+    @classmethod
+    def desde_dict(cls, datos):
+        h = cls(datos['bits_precision'])
+        h.buckets = {int(k): v for k, v in datos['buckets'].items()}
+        h.total = datos['total']
+        h.suma_us = datos['suma_us']
+        h.minimo_us = datos['minimo_us']
+        h.maximo_us = datos['maximo_us']
+        return h
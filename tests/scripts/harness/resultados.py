@@ -0,0 +1,373 @@
+"""
+ALMACÉN PERSISTENTE DE RESULTADOS (SQLite)
+
+Guarda cada corrida de los scripts del harness (metadata, git SHA, latencia
+y tamaño de payload de cada request, PASS/FAIL de cada test) en una base
+SQLite local para poder ver tendencias entre corridas.
+
+Durante la corrida las mediciones se acumulan en memoria y se escriben en
+una sola transacción al final, así registrar no distorsiona lo medido.
+
+Uso desde un script:
+    registro = Registro("test-backend-portal-docente", base_url=BASE_URL)
+    http = registro.session()          # requests.Session instrumentada
+    registro.test_actual = "GET /docentes/me"
+    ...
+    registro.registrar_test(nombre, 'PASS')
+    registro.guardar(passed, failed)
+
+Consultas (desde tests/scripts):
+    python -m harness.resultados corridas
+    python -m harness.resultados tendencias --endpoint "GET /eventos/estadisticas"
+    python -m harness.resultados regresiones --umbral 1.5
+    python -m harness.resultados exportar mediciones.csv
+"""
+
+import argparse
+import csv
+import os
+import re
+import socket
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from http.cookiejar import DefaultCookiePolicy
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+
+from .comun import BASE_URL, GREEN, RED, YELLOW, NC, titulo
+
+DB_DEFAULT = Path(__file__).resolve().parent.parent / ".resultados" / "harness.db"
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS corridas (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    script TEXT NOT NULL,
+    inicio TEXT NOT NULL,
+    fin TEXT NOT NULL,
+    git_sha TEXT,
+    git_sucio INTEGER,
+    base_url TEXT,
+    host TEXT,
+    passed INTEGER,
+    failed INTEGER
+);
+CREATE TABLE IF NOT EXISTS mediciones (
+    corrida_id INTEGER NOT NULL REFERENCES corridas(id),
+    test TEXT,
+    endpoint TEXT NOT NULL,
+    status_code INTEGER,
+    latencia_ms REAL NOT NULL,
+    bytes_peticion INTEGER,
+    bytes_respuesta INTEGER
+);
+CREATE TABLE IF NOT EXISTS tests (
+    corrida_id INTEGER NOT NULL REFERENCES corridas(id),
+    nombre TEXT NOT NULL,
+    estado TEXT NOT NULL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_mediciones_endpoint ON mediciones(endpoint, corrida_id);
+CREATE INDEX IF NOT EXISTS idx_tests_nombre ON tests(nombre, corrida_id);
+"""
+
+# Segmentos de ruta que son IDs (uuid, cuid o numéricos) -> :id
+_SEGMENTO_ID = re.compile(
+    r'^(?:[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|c[a-z0-9]{20,}|\d+)$',
+    re.IGNORECASE,
+)
+
+
+def normalizar_endpoint(metodo, url, base_url=BASE_URL):
+    """'GET', 'http://host/api/estudiantes/<uuid>' -> 'GET /estudiantes/:id'"""
+    ruta = urlsplit(url).path
+    prefijo = urlsplit(base_url).path.rstrip('/')
+    if prefijo and ruta.startswith(prefijo):
+        ruta = ruta[len(prefijo):]
+    segmentos = [':id' if _SEGMENTO_ID.match(s) else s for s in ruta.split('/')]
+    return f"{metodo} {'/'.join(segmentos) or '/'}"
+
+
+def _git(*args):
+    try:
+        return subprocess.run(
+            ["git", *args], cwd=Path(__file__).resolve().parent,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def conectar(db=None):
+    ruta = Path(db or os.environ.get("HARNESS_DB") or DB_DEFAULT)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    conexion = sqlite3.connect(ruta)
+    conexion.executescript(ESQUEMA)
+    return conexion
+
+
+class Registro:
+    """Acumula las mediciones de una corrida en memoria y las persiste juntas"""
+
+    def __init__(self, script, base_url=BASE_URL, db=None):
+        """
+        Args:
+            script: nombre con el que se agrupan las corridas
+            base_url: URL base de la API que usa el script (se guarda con la
+                corrida y se quita de las rutas al normalizar endpoints)
+            db: ruta de la base (por defecto $HARNESS_DB o DB_DEFAULT)
+        """
+        self.script = script
+        self.base_url = base_url
+        self.db = db
+        self.inicio = datetime.now().isoformat(timespec='seconds')
+        self.test_actual = None
+        self.mediciones = []
+        self.tests = []
+
+    def session(self):
+        """
+        requests.Session que mide cada request completo, incluida la
+        descarga del cuerpo (r.elapsed se corta al recibir los headers).
+
+        No guarda cookies: /auth/login setea `auth-token` y JwtStrategy la
+        prefiere al header Authorization, así que el script terminaría
+        autenticándose por cookie y no con los headers que arma.
+        """
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        request = session.request
+
+        def medir(method, url, *args, **kwargs):
+            inicio = time.perf_counter()
+            r = request(method, url, *args, **kwargs)
+            self._registrar_medicion(r, (time.perf_counter() - inicio) * 1000)
+            return r
+
+        session.request = medir
+        return session
+
+    def _registrar_medicion(self, r, latencia_ms):
+        cuerpo = r.request.body
+        self.mediciones.append((
+            self.test_actual,
+            normalizar_endpoint(r.request.method, r.request.url, self.base_url),
+            r.status_code,
+            latencia_ms,
+            len(cuerpo) if cuerpo else 0,
+            len(r.content),
+        ))
+
+    def registrar_test(self, nombre, estado, error=None):
+        self.tests.append((nombre, estado, error))
+
+    def guardar(self, passed, failed):
+        """Escribe la corrida completa en una única transacción"""
+        conexion = conectar(self.db)
+        try:
+            with conexion:
+                cursor = conexion.execute(
+                    "INSERT INTO corridas (script, inicio, fin, git_sha, git_sucio, base_url, host, passed, failed) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (self.script, self.inicio, datetime.now().isoformat(timespec='seconds'),
+                     _git("rev-parse", "HEAD"), int(bool(_git("status", "--porcelain"))),
+                     self.base_url, socket.gethostname(), passed, failed),
+                )
+                corrida_id = cursor.lastrowid
+                conexion.executemany(
+                    "INSERT INTO mediciones VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(corrida_id, *m) for m in self.mediciones],
+                )
+                conexion.executemany(
+                    "INSERT INTO tests VALUES (?, ?, ?, ?)",
+                    [(corrida_id, *t) for t in self.tests],
+                )
+        finally:
+            conexion.close()
+        return corrida_id
+
+
+# =========================================
+# CONSULTAS
+# =========================================
+
+def series_por_endpoint(conexion, script=None, endpoint=None):
+    """
+    Returns:
+        dict: endpoint -> [(corrida_id, inicio, git_sha, mediana_ms, bytes_mediana, n)]
+    """
+    filtros, params = [], []
+    if script:
+        filtros.append("c.script = ?")
+        params.append(script)
+    if endpoint:
+        filtros.append("m.endpoint = ?")
+        params.append(endpoint)
+    where = f"WHERE {' AND '.join(filtros)}" if filtros else ""
+    filas = conexion.execute(
+        f"SELECT m.endpoint, c.id, c.inicio, c.git_sha, m.latencia_ms, m.bytes_respuesta "
+        f"FROM mediciones m JOIN corridas c ON c.id = m.corrida_id {where} "
+        f"ORDER BY m.endpoint, c.inicio, c.id",
+        params,
+    ).fetchall()
+
+    agrupado = {}
+    for ep, corrida_id, inicio, sha, latencia, tamanio in filas:
+        agrupado.setdefault(ep, {}).setdefault((corrida_id, inicio, sha), []).append((latencia, tamanio))
+
+    series = {}
+    for ep, corridas in agrupado.items():
+        series[ep] = [
+            (cid, inicio, sha,
+             statistics.median(l for l, _ in valores),
+             statistics.median(t for _, t in valores),
+             len(valores))
+            for (cid, inicio, sha), valores in corridas.items()
+        ]
+    return series
+
+
+def detectar_regresiones(serie, umbral, ventana):
+    """
+    Compara cada corrida contra una línea base fija: la mediana de las
+    primeras `ventana` corridas. Así un deterioro gradual (80ms -> 90ms ->
+    ... -> 400ms) se detecta aunque cada paso sea chico.
+
+    Marca la primera corrida que supera `umbral` veces la línea base y que
+    la corrida siguiente confirma; la última corrida nunca se marca sola
+    (puede ser un pico aislado). Después de una regresión, la línea base
+    pasa a ser el nuevo nivel para detectar la siguiente.
+
+    Returns:
+        list: [(base_ms, punto_regresion)]
+    """
+    regresiones = []
+    inicio_base = 0
+    i = ventana
+    while i + 1 < len(serie):
+        base = statistics.median(p[3] for p in serie[inicio_base:inicio_base + ventana])
+        limite = base * umbral
+        if base > 0 and serie[i][3] > limite and serie[i + 1][3] > limite:
+            regresiones.append((base, serie[i]))
+            inicio_base = i
+            i += ventana
+        else:
+            i += 1
+    return regresiones
+
+
+def _sha(sha):
+    return (sha or 'sin-git')[:8]
+
+
+def cmd_corridas(conexion, args):
+    titulo("CORRIDAS REGISTRADAS")
+    for cid, script, inicio, sha, sucio, passed, failed in conexion.execute(
+        "SELECT id, script, inicio, git_sha, git_sucio, passed, failed FROM corridas "
+        "ORDER BY inicio DESC, id DESC LIMIT ?", (args.ultimas,)
+    ):
+        color = GREEN if not failed else RED
+        print(f"  #{cid:<5} {inicio}  {_sha(sha)}{'*' if sucio else ' '}  {script:<32} "
+              f"{color}{passed} ok / {failed} fallidos{NC}")
+    print()
+
+
+def cmd_tendencias(conexion, args):
+    titulo("TENDENCIAS DE LATENCIA (mediana por corrida)")
+    for ep, serie in sorted(series_por_endpoint(conexion, args.script, args.endpoint).items()):
+        serie = serie[-args.ultimas:]
+        primera, ultima = serie[0][3], serie[-1][3]
+        cambio = (ultima - primera) / primera * 100 if primera else 0.0
+        color = RED if cambio > 50 else YELLOW if cambio > 20 else GREEN
+        print(f"  {ep:<45} {primera:>8.1f}ms -> {ultima:>8.1f}ms  {color}{cambio:+6.1f}%{NC}  "
+              f"({len(serie)} corridas, payload {serie[-1][4]:.0f} B)")
+        if args.endpoint:
+            for cid, inicio, sha, mediana, tamanio, n in serie:
+                print(f"      #{cid:<5} {inicio}  {_sha(sha)}  {mediana:>8.1f}ms  {tamanio:>8.0f} B  n={n}")
+    print()
+
+
+def cmd_regresiones(conexion, args):
+    titulo(f"REGRESIONES (> {args.umbral}x la mediana de las primeras {args.ventana} corridas)")
+    encontradas = 0
+    for ep, serie in sorted(series_por_endpoint(conexion, args.script, args.endpoint).items()):
+        for base, (cid, inicio, sha, mediana, _, _) in detectar_regresiones(serie, args.umbral, args.ventana):
+            encontradas += 1
+            print(f"  {RED}✗{NC} {ep:<45} {base:>7.1f}ms -> {mediana:>7.1f}ms  "
+                  f"desde commit {_sha(sha)} (corrida #{cid}, {inicio})")
+
+    # Tests que pasaban y empezaron a fallar
+    filas = conexion.execute(
+        "SELECT t.nombre, c.id, c.inicio, c.git_sha, t.estado FROM tests t "
+        "JOIN corridas c ON c.id = t.corrida_id ORDER BY t.nombre, c.inicio, c.id"
+    ).fetchall()
+    anterior = {}
+    for nombre, cid, inicio, sha, estado in filas:
+        if anterior.get(nombre) == 'PASS' and estado == 'FAIL':
+            encontradas += 1
+            print(f"  {RED}✗{NC} {nombre:<45} PASS -> FAIL desde commit {_sha(sha)} (corrida #{cid}, {inicio})")
+        anterior[nombre] = estado
+
+    if not encontradas:
+        print(f"  {GREEN}✓ Sin regresiones detectadas{NC}")
+    print()
+
+
+def cmd_exportar(conexion, args):
+    filas = conexion.execute(
+        "SELECT c.id, c.script, c.inicio, c.git_sha, m.test, m.endpoint, m.status_code, "
+        "m.latencia_ms, m.bytes_peticion, m.bytes_respuesta "
+        "FROM mediciones m JOIN corridas c ON c.id = m.corrida_id ORDER BY c.inicio, c.id"
+    )
+    with open(args.archivo, 'w', newline='') as f:
+        escritor = csv.writer(f)
+        escritor.writerow([d[0] for d in filas.description])
+        escritor.writerows(filas)
+    print(f"{GREEN}✓ Exportado a {args.archivo}{NC}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Consultas sobre el almacén de resultados del harness")
+    parser.add_argument("--db", help=f"Ruta de la base (por defecto $HARNESS_DB o {DB_DEFAULT})")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p = sub.add_parser("corridas", help="Listar corridas")
+    p.add_argument("--ultimas", type=int, default=20)
+
+    p = sub.add_parser("tendencias", help="Evolución de la latencia por endpoint")
+    p.add_argument("--endpoint", help='p. ej. "GET /eventos/estadisticas"')
+    p.add_argument("--script")
+    p.add_argument("--ultimas", type=int, default=30)
+
+    p = sub.add_parser("regresiones", help="Commits donde empezó una regresión")
+    p.add_argument("--endpoint")
+    p.add_argument("--script")
+    p.add_argument("--umbral", type=float, default=1.5, help="Factor sobre la línea base")
+    p.add_argument("--ventana", type=int, default=3, help="Corridas iniciales que forman la línea base")
+
+    p = sub.add_parser("exportar", help="Exportar mediciones a CSV")
+    p.add_argument("archivo")
+
+    args = parser.parse_args()
+    conexion = conectar(args.db)
+    try:
+        {
+            'corridas': cmd_corridas,
+            'tendencias': cmd_tendencias,
+            'regresiones': cmd_regresiones,
+            'exportar': cmd_exportar,
+        }[args.comando](conexion, args)
+    except sqlite3.Error as e:
+        print(f"{RED}✗ {e}{NC}")
+        sys.exit(1)
+    finally:
+        conexion.close()
+
+
+if __name__ == "__main__":
+    main()
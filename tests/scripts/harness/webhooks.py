@@ -0,0 +1,573 @@
+"""
+REPLAY DE RÁFAGAS DE WEBHOOKS DE MERCADOPAGO
+
+Genera notificaciones de pago con el formato y la firma que valida
+MercadoPagoWebhookGuard (x-signature "ts=...,v1=HMAC-SHA256(ts.rawBody)"),
+incluyendo duplicados y eventos fuera de orden, y las dispara contra
+POST /pagos/webhook a la tasa y tamaño de ráfaga configurados.
+
+Incluye un stand-in local de la API de pagos de MercadoPago
+(GET /v1/payments/:id) para que la API no salga a internet. Levantar la API
+con:
+
+    MERCADOPAGO_ACCESS_TOKEN=TEST-standin
+    MERCADOPAGO_API_BASE_URL=http://127.0.0.1:8765
+    MERCADOPAGO_WEBHOOK_SECRET=<el mismo que --secreto>
+
+Cada pago necesita una InscripcionMensual real (si no, el webhook falla
+con 5xx): las external_reference salen de --referencias o, con
+--database-url / DATABASE_URL, de inscripciones pendientes de la base.
+Esas inscripciones quedan marcadas como pagadas. Cada pago lleva como
+transaction_amount el precio_final de su inscripción, para que la ingesta
+pase por la validación de monto igual que en producción (--monto fija otro
+valor; --monto 0 la omite).
+
+El reporte cubre throughput de ingesta, latencia de ack, lag de
+procesamiento (envío -> primera consulta al stand-in; el webhook se procesa
+sincrónicamente, sin cola) e idempotencia: ningún pago puede procesarse más
+de una vez. Con acceso a la base, la idempotencia se
+verifica también sobre el estado persistido (webhooks_processed y
+inscripciones_mensuales.fecha_pago), vía psql.
+
+La corrida falla (exit 1) si ningún webhook se procesó, si alguno respondió
+no-2xx o si algún pago se acreditó más de una vez.
+
+Uso (desde tests/scripts):
+    python -m harness.webhooks replay --pagos 500 --tasa 200 --rafaga 50
+    python -m harness.webhooks replay --referencias refs.txt --duplicados 0.3 --desorden 0.2
+    python -m harness.webhooks standin --puerto 8765
+"""
+
+import argparse
+import hashlib
+import hmac
+import json
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+
+from .comun import BASE_URL, GREEN, RED, YELLOW, NC, HarnessError, seccion, titulo
+from .histograma import Histograma
+
+RUTA_WEBHOOK = "/pagos/webhook"
+MENSAJE_IDEMPOTENTE = "Webhook already processed (idempotent)"
+PUERTO_STANDIN = 8765
+
+
+# =========================================
+# STAND-IN DE LA API DE PAGOS
+# =========================================
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _responder(self, status, cuerpo):
+        datos = json.dumps(cuerpo).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(datos)))
+        self.end_headers()
+        self.wfile.write(datos)
+
+    def do_GET(self):
+        estado = self.server.estado
+        if self.path == "/_stats":
+            with estado['lock']:
+                return self._responder(200, {
+                    'consultas': estado['consultas'],
+                    'primera_consulta': estado['primera_consulta'],
+                })
+
+        if not self.path.startswith("/v1/payments/"):
+            return self._responder(404, {'message': 'not_found'})
+
+        payment_id = self.path.rsplit("/", 1)[-1]
+        with estado['lock']:
+            pago = estado['pagos'].get(payment_id)
+            if pago is not None:
+                estado['consultas'][payment_id] = estado['consultas'].get(payment_id, 0) + 1
+                estado['primera_consulta'].setdefault(payment_id, time.time())
+
+        if estado['latencia']:
+            time.sleep(estado['latencia'])
+        if pago is None:
+            return self._responder(404, {'message': 'Payment not found', 'status': 404})
+        return self._responder(200, pago)
+
+    def do_POST(self):
+        # Registro de pagos por el replay: POST /_pagos [{...}, ...]
+        if self.path != "/_pagos":
+            return self._responder(404, {'message': 'not_found'})
+        largo = int(self.headers.get("Content-Length", 0))
+        pagos = json.loads(self.rfile.read(largo) or b"[]")
+        estado = self.server.estado
+        with estado['lock']:
+            for pago in pagos:
+                estado['pagos'][str(pago['id'])] = pago
+        return self._responder(201, {'registrados': len(pagos)})
+
+
+def servir_standin(puerto=PUERTO_STANDIN, latencia_ms=0.0):
+    servidor = ThreadingHTTPServer(("127.0.0.1", puerto), _StandInHandler)
+    servidor.request_queue_size = 1024
+    servidor.estado = {
+        'lock': threading.Lock(),
+        'pagos': {},
+        'consultas': {},
+        'primera_consulta': {},
+        'latencia': latencia_ms / 1000,
+    }
+    servidor.serve_forever()
+
+
+def iniciar_standin(puerto, latencia_ms):
+    """Levanta el stand-in en un proceso aparte (no compite por el GIL)"""
+    proceso = multiprocessing.Process(target=servir_standin, args=(puerto, latencia_ms), daemon=True)
+    proceso.start()
+    url = f"http://127.0.0.1:{puerto}"
+    for _ in range(50):
+        try:
+            requests.get(f"{url}/_stats", timeout=0.5)
+            return proceso, url
+        except requests.RequestException:
+            time.sleep(0.1)
+    proceso.terminate()
+    raise HarnessError(f"El stand-in no respondió en el puerto {puerto}")
+
+
+# =========================================
+# GENERACIÓN DE NOTIFICACIONES
+# =========================================
+
+def generar_pagos(referencias, montos, rng):
+    """Un pago aprobado por external_reference (cada inscripción se paga una vez)"""
+    pagos = []
+    for referencia, monto in zip(referencias, montos):
+        ahora = datetime.now(timezone.utc).isoformat()
+        pagos.append({
+            'id': rng.randint(10**10, 10**11 - 1),
+            'status': 'approved',
+            'status_detail': 'accredited',
+            'external_reference': referencia,
+            'transaction_amount': monto,
+            'date_created': ahora,
+            'date_approved': ahora,
+        })
+    return pagos
+
+
+def generar_notificaciones(pagos, duplicados, desorden, rng):
+    """
+    Por cada pago: payment.created y payment.updated. Una fracción
+    `duplicados` de las notificaciones se reenvía 1-3 veces (como hace
+    MercadoPago ante timeouts) y una fracción `desorden` se intercambia con
+    una vecina para que lleguen fuera de orden.
+    """
+    notificaciones = []
+    for pago in pagos:
+        for accion in ("payment.created", "payment.updated"):
+            notificacion = {
+                'id': rng.randint(10**10, 10**11 - 1),
+                'live_mode': False,
+                'type': 'payment',
+                'date_created': datetime.now(timezone.utc).isoformat(),
+                'user_id': '123456789',
+                'api_version': 'v1',
+                'action': accion,
+                'data': {'id': str(pago['id'])},
+            }
+            copias = 1 + (rng.randint(1, 3) if rng.random() < duplicados else 0)
+            notificaciones.extend([notificacion] * copias)
+
+    for i in range(len(notificaciones) - 1):
+        if rng.random() < desorden:
+            notificaciones[i], notificaciones[i + 1] = notificaciones[i + 1], notificaciones[i]
+    return notificaciones
+
+
+def firmar(cuerpo_crudo, secreto):
+    ts = int(time.time())
+    firma = hmac.new(secreto.encode(), f"{ts}.{cuerpo_crudo}".encode(), hashlib.sha256).hexdigest()
+    return f"ts={ts},v1={firma}"
+
+
+# =========================================
+# ESTADO PERSISTIDO (psql)
+# =========================================
+
+def _url_psql(database_url):
+    # Prisma agrega ?schema=public, que libpq no acepta
+    partes = urlsplit(database_url)
+    return urlunsplit(partes._replace(query=""))
+
+
+def consultar_db(database_url, sql):
+    """
+    Ejecuta `sql` con psql y devuelve las filas como listas de strings.
+
+    Raises:
+        HarnessError: si psql no está instalado o la consulta falla
+    """
+    try:
+        r = subprocess.run(
+            ["psql", _url_psql(database_url), "-v", "ON_ERROR_STOP=1", "-At", "-F", "\t", "-c", sql],
+            capture_output=True, text=True, timeout=60,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise HarnessError(f"No se pudo ejecutar psql: {e}")
+    if r.returncode != 0:
+        raise HarnessError(f"psql falló: {r.stderr.strip()[:300]}")
+    return [linea.split("\t") for linea in r.stdout.splitlines() if linea]
+
+
+def _lista_sql(valores):
+    return ", ".join("'" + str(v).replace("'", "''") + "'" for v in valores)
+
+
+def referencias_desde_db(database_url, cantidad):
+    """
+    Inscripciones mensuales todavía sin pagar.
+
+    Returns:
+        list: [(external_reference, precio_final)]
+    """
+    filas = consultar_db(database_url, (
+        "SELECT id, estudiante_id, producto_id, precio_final FROM inscripciones_mensuales "
+        f"WHERE estado_pago <> 'Pagado' AND fecha_pago IS NULL ORDER BY id LIMIT {int(cantidad)}"
+    ))
+    return [(f"inscripcion-{i}-estudiante-{e}-producto-{p}", float(precio)) for i, e, p, precio in filas]
+
+
+def inscripcion_de(referencia):
+    # Mismo parseo que PaymentWebhookService: "inscripcion-{id}-estudiante-..."
+    return referencia.split("-")[1]
+
+
+def precios_desde_db(database_url, referencias):
+    """
+    precio_final de la inscripción de cada referencia.
+
+    Raises:
+        HarnessError: si alguna inscripción no existe
+    """
+    precios = dict(consultar_db(database_url, (
+        "SELECT id, precio_final FROM inscripciones_mensuales "
+        f"WHERE id IN ({_lista_sql(inscripcion_de(r) for r in referencias)})"
+    )))
+    faltantes = [r for r in referencias if inscripcion_de(r) not in precios]
+    if faltantes:
+        raise HarnessError(f"{len(faltantes)} referencias sin inscripción en la base (p. ej. {faltantes[0]})")
+    return [float(precios[inscripcion_de(r)]) for r in referencias]
+
+
+def verificar_persistido(database_url, pagos):
+    """
+    Cruza webhooks_processed con inscripciones_mensuales.
+
+    Un webhook procesado una sola vez actualiza la inscripción y después
+    crea el registro de idempotencia, así que `fecha_pago` nunca es
+    posterior a `processed_at`. Si lo es, la inscripción se volvió a
+    acreditar después de quedar marcada como procesada.
+
+    Returns:
+        dict con sin_registro, sin_fecha_pago y reacreditados
+    """
+    ids_pago = [str(p['id']) for p in pagos]
+    registros = {
+        pid: (referencia, float(procesado))
+        for pid, referencia, procesado in consultar_db(database_url, (
+            "SELECT payment_id, external_reference, EXTRACT(EPOCH FROM processed_at) "
+            f"FROM webhooks_processed WHERE payment_id IN ({_lista_sql(ids_pago)})"
+        ))
+    }
+    inscripciones = {
+        iid: (estado, float(fecha) if fecha else None)
+        for iid, estado, fecha in consultar_db(database_url, (
+            "SELECT id, estado_pago, EXTRACT(EPOCH FROM fecha_pago) FROM inscripciones_mensuales "
+            f"WHERE id IN ({_lista_sql(inscripcion_de(p['external_reference']) for p in pagos)})"
+        ))
+    }
+
+    sin_registro = [pid for pid in ids_pago if pid not in registros]
+    sin_fecha_pago = []
+    reacreditados = {}
+    for pago in pagos:
+        estado, fecha_pago = inscripciones.get(inscripcion_de(pago['external_reference']), (None, None))
+        if fecha_pago is None:
+            sin_fecha_pago.append(str(pago['id']))
+        elif str(pago['id']) in registros and fecha_pago > registros[str(pago['id'])][1]:
+            reacreditados[str(pago['id'])] = fecha_pago - registros[str(pago['id'])][1]
+    return {'sin_registro': sin_registro, 'sin_fecha_pago': sin_fecha_pago, 'reacreditados': reacreditados}
+
+
+# =========================================
+# REPLAY
+# =========================================
+
+def disparar(notificaciones, args):
+    sesiones = threading.local()
+    lock = threading.Lock()
+    histograma = Histograma()
+    estados = Counter()
+    primer_envio = {}
+    procesados = Counter()
+
+    def enviar(notificacion):
+        if not hasattr(sesiones, 'session'):
+            sesiones.session = requests.Session()
+        crudo = json.dumps(notificacion)
+        headers = {'Content-Type': 'application/json', 'x-request-id': str(uuid.uuid4())}
+        if args.secreto:
+            headers['x-signature'] = firmar(crudo, args.secreto)
+        payment_id = notificacion['data']['id']
+        inicio = time.time()
+        with lock:
+            primer_envio.setdefault(payment_id, inicio)
+        try:
+            r = sesiones.session.post(f"{BASE_URL}{args.ruta}", data=crudo, headers=headers, timeout=30)
+            estado = str(r.status_code)
+            cuerpo = r.json() if r.content else {}
+        except (requests.RequestException, ValueError):
+            estado, cuerpo = 'conexion', {}
+        ms = (time.time() - inicio) * 1000
+        with lock:
+            histograma.registrar(ms)
+            estados[estado] += 1
+            if (estado.startswith('2') and isinstance(cuerpo, dict)
+                    and cuerpo.get('message') != MENSAJE_IDEMPOTENTE and cuerpo.get('success') is not False):
+                procesados[payment_id] += 1
+
+    intervalo = args.rafaga / args.tasa
+    inicio = time.time()
+    with ThreadPoolExecutor(max_workers=args.conexiones) as pool:
+        for n, desde in enumerate(range(0, len(notificaciones), args.rafaga)):
+            espera = inicio + n * intervalo - time.time()
+            if espera > 0:
+                time.sleep(espera)
+            for notificacion in notificaciones[desde:desde + args.rafaga]:
+                pool.submit(enviar, notificacion)
+    duracion = time.time() - inicio
+
+    return {
+        'duracion': duracion,
+        'histograma': histograma,
+        'estados': estados,
+        'primer_envio': primer_envio,
+        'procesados': procesados,
+    }
+
+
+def esperar_consultas(url_standin, quietud, timeout):
+    """Espera hasta que el stand-in deja de recibir consultas por `quietud` segundos"""
+    limite = time.time() + timeout
+    anterior = None
+    ultimo_cambio = time.time()
+    while time.time() < limite:
+        stats = requests.get(f"{url_standin}/_stats", timeout=5).json()
+        total = sum(stats['consultas'].values())
+        if total != anterior:
+            anterior, ultimo_cambio = total, time.time()
+        elif time.time() - ultimo_cambio >= quietud:
+            return stats
+        time.sleep(0.25)
+    return requests.get(f"{url_standin}/_stats", timeout=5).json()
+
+
+def imprimir_reporte(pagos, notificaciones, corrida, stats, persistido=None):
+    """
+    Returns:
+        list: motivos por los que la corrida falla (vacía si pasó)
+    """
+    fallas = []
+
+    seccion("INGESTA")
+    h = corrida['histograma']
+    exitosos = sum(n for e, n in corrida['estados'].items() if e.startswith('2'))
+    errores = {e: n for e, n in corrida['estados'].items() if not e.startswith('2')}
+    print(f"  Notificaciones: {len(notificaciones)} ({len(notificaciones) - 2 * len(pagos)} duplicadas) "
+          f"para {len(pagos)} pagos")
+    print(f"  Throughput: {exitosos / corrida['duracion']:.1f} acks/s | "
+          f"{RED if errores else GREEN}errores {errores or 0}{NC}")
+    print(f"  Latencia de ack: p50 {h.percentil(50):.1f}ms  p99 {h.percentil(99):.1f}ms  max {h.maximo:.1f}ms\n")
+    if errores:
+        fallas.append(f"{sum(errores.values())} notificaciones con respuesta no-2xx {errores}")
+
+    seccion("LAG DE PROCESAMIENTO")
+    lag = Histograma()
+    for payment_id, t in stats['primera_consulta'].items():
+        if payment_id in corrida['primer_envio']:
+            lag.registrar((t - corrida['primer_envio'][payment_id]) * 1000)
+    sin_consulta = len(pagos) - len(stats['primera_consulta'])
+    print(f"  Envío -> consulta a MercadoPago: p50 {lag.percentil(50):.1f}ms  "
+          f"p99 {lag.percentil(99):.1f}ms  max {lag.maximo:.1f}ms")
+    if sin_consulta:
+        print(f"  {YELLOW}⚠ {sin_consulta} pagos nunca fueron consultados{NC}")
+    print()
+
+    seccion("IDEMPOTENCIA")
+    procesados = len(corrida['procesados'])
+    print(f"  Pagos procesados según las respuestas: {procesados}/{len(pagos)}")
+    if not procesados:
+        fallas.append("ningún webhook se procesó (sin acreditaciones no se probó la idempotencia)")
+
+    dobles = {pid: n for pid, n in corrida['procesados'].items() if n > 1}
+    consultas_multiples = {pid: n for pid, n in stats['consultas'].items() if n > 1}
+    if consultas_multiples:
+        print(f"  {YELLOW}⚠ {len(consultas_multiples)} pagos consultados más de una vez "
+              f"(el chequeo de idempotencia no frenó duplicados concurrentes){NC}")
+    if dobles:
+        print(f"  {RED}✗ {len(dobles)} pagos procesados más de una vez según las respuestas{NC}")
+        for pid, n in list(dobles.items())[:10]:
+            print(f"    └─ payment_id={pid}: {n} veces")
+        fallas.append(f"{len(dobles)} pagos procesados más de una vez")
+
+    if persistido is None:
+        print(f"  {YELLOW}⚠ Sin --database-url: no se verificó el estado persistido{NC}")
+    else:
+        print(f"  Registros en webhooks_processed: {len(pagos) - len(persistido['sin_registro'])}/{len(pagos)} | "
+              f"inscripciones con fecha_pago: {len(pagos) - len(persistido['sin_fecha_pago'])}/{len(pagos)}")
+        if persistido['sin_registro']:
+            fallas.append(f"{len(persistido['sin_registro'])} pagos sin registro en webhooks_processed")
+        if persistido['sin_fecha_pago']:
+            fallas.append(f"{len(persistido['sin_fecha_pago'])} inscripciones sin fecha_pago")
+        if persistido['reacreditados']:
+            print(f"  {RED}✗ {len(persistido['reacreditados'])} inscripciones reacreditadas después de "
+                  f"quedar marcadas como procesadas{NC}")
+            for pid, delta in list(persistido['reacreditados'].items())[:10]:
+                print(f"    └─ payment_id={pid}: fecha_pago {delta * 1000:.0f}ms después de processed_at")
+            fallas.append(f"{len(persistido['reacreditados'])} inscripciones acreditadas dos veces")
+
+    if not dobles and not (persistido and persistido['reacreditados']) and procesados:
+        print(f"  {GREEN}✓ Ningún pago procesado dos veces{NC}")
+    print()
+    return fallas
+
+
+def replay(args):
+    titulo("REPLAY DE WEBHOOKS DE MERCADOPAGO")
+    rng = random.Random(args.semilla)
+
+    try:
+        if args.referencias:
+            with open(args.referencias) as f:
+                referencias = [linea.strip() for linea in f if linea.strip()][:args.pagos]
+            if any(not r.startswith("inscripcion-") for r in referencias):
+                raise HarnessError("Las referencias deben tener el formato inscripcion-{id}-estudiante-{id}-producto-{id}")
+            if args.monto is not None:
+                montos = [args.monto] * len(referencias)
+            elif args.database_url:
+                montos = precios_desde_db(args.database_url, referencias) if referencias else []
+            else:
+                raise HarnessError("Sin --database-url no se conoce el precio_final de las inscripciones: "
+                                   "pasar --monto (o --monto 0 para omitir la validación de monto)")
+        elif args.database_url:
+            filas = referencias_desde_db(args.database_url, args.pagos)
+            referencias = [r for r, _ in filas]
+            montos = [args.monto if args.monto is not None else precio for _, precio in filas]
+        else:
+            raise HarnessError("Hacen falta inscripciones reales: usar --referencias o --database-url "
+                               "(con referencias inventadas todos los webhooks fallan)")
+        if not referencias:
+            raise HarnessError("No hay inscripciones pendientes para pagar")
+    except (HarnessError, OSError) as e:
+        print(f"{RED}✗ {e}{NC}")
+        sys.exit(1)
+    if len(referencias) < args.pagos:
+        print(f"{YELLOW}⚠ Sólo hay {len(referencias)} inscripciones: se envían {len(referencias)} pagos{NC}")
+
+    proceso_standin = None
+    url_standin = args.standin_url
+    if not url_standin:
+        proceso_standin, url_standin = iniciar_standin(args.puerto, args.latencia_standin_ms)
+    print(f"Stand-in de MercadoPago: {url_standin}")
+    if not args.secreto:
+        print(f"{YELLOW}⚠ Sin --secreto: notificaciones sin firmar (sólo pasan en modo desarrollo){NC}")
+    if args.monto == 0:
+        print(f"{YELLOW}⚠ --monto 0: la API omite la validación de monto de cada pago{NC}")
+
+    try:
+        pagos = generar_pagos(referencias, montos, rng)
+        requests.post(f"{url_standin}/_pagos", json=pagos, timeout=30).raise_for_status()
+        notificaciones = generar_notificaciones(pagos, args.duplicados, args.desorden, rng)
+
+        print(f"Disparando {len(notificaciones)} notificaciones a {args.tasa} req/s "
+              f"en ráfagas de {args.rafaga}...\n")
+        corrida = disparar(notificaciones, args)
+        stats = esperar_consultas(url_standin, quietud=args.quietud, timeout=args.timeout)
+        persistido = verificar_persistido(args.database_url, pagos) if args.database_url else None
+    except (HarnessError, requests.RequestException) as e:
+        print(f"{RED}✗ {e}{NC}")
+        sys.exit(1)
+    finally:
+        if proceso_standin:
+            proceso_standin.terminate()
+
+    fallas = imprimir_reporte(pagos, notificaciones, corrida, stats, persistido)
+    if fallas:
+        print(f"{RED}REPLAY FALLIDO:{NC}\n")
+        for falla in fallas:
+            print(f"  {RED}✗{NC} {falla}")
+        print()
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay de webhooks de MercadoPago")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p_standin = sub.add_parser("standin", help="Sólo levantar el stand-in de la API de pagos")
+    p_standin.add_argument("--puerto", type=int, default=PUERTO_STANDIN)
+    p_standin.add_argument("--latencia-standin-ms", type=float, default=0.0)
+
+    p_replay = sub.add_parser("replay", help="Disparar ráfagas de notificaciones")
+    p_replay.add_argument("--pagos", type=int, default=200)
+    p_replay.add_argument("--tasa", type=float, default=100.0, help="Notificaciones por segundo")
+    p_replay.add_argument("--rafaga", type=int, default=20, help="Notificaciones liberadas juntas")
+    p_replay.add_argument("--duplicados", type=float, default=0.2, help="Fracción reenviada")
+    p_replay.add_argument("--desorden", type=float, default=0.1, help="Fracción fuera de orden")
+    p_replay.add_argument("--monto", type=float, default=None,
+                          help="transaction_amount fijo (por defecto, el precio_final de cada inscripción; "
+                               "0 omite la validación de monto)")
+    p_replay.add_argument("--referencias", help="Archivo con external_reference reales, uno por línea")
+    p_replay.add_argument("--database-url", default=os.environ.get("DATABASE_URL"),
+                          help="Postgres de la API: toma inscripciones pendientes y verifica el estado persistido (psql)")
+    p_replay.add_argument("--secreto", default=os.environ.get("MERCADOPAGO_WEBHOOK_SECRET"))
+    p_replay.add_argument("--ruta", default=RUTA_WEBHOOK)
+    p_replay.add_argument("--conexiones", type=int, default=32)
+    p_replay.add_argument("--standin-url", help="Usar un stand-in ya levantado")
+    p_replay.add_argument("--puerto", type=int, default=PUERTO_STANDIN)
+    p_replay.add_argument("--latencia-standin-ms", type=float, default=50.0,
+                          help="Latencia simulada de la API de MercadoPago")
+    p_replay.add_argument("--quietud", type=float, default=3.0,
+                          help="Segundos sin consultas para dar por terminado el procesamiento")
+    p_replay.add_argument("--timeout", type=float, default=120.0)
+    p_replay.add_argument("--semilla", type=int, default=None)
+
+    args = parser.parse_args()
+    if args.comando == "standin":
+        print(f"Stand-in de MercadoPago escuchando en http://127.0.0.1:{args.puerto}")
+        try:
+            servir_standin(args.puerto, args.latencia_standin_ms)
+        except KeyboardInterrupt:
+            pass
+        return
+    replay(args)
+
+
+if __name__ == "__main__":
+    main()
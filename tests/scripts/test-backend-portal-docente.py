@@ -5,11 +5,12 @@ Testea TODOS los módulos y endpoints disponibles para docentes
 Version corregida con URLs profesionales y precisas
 """
 
-import requests
 import json
 import sys
 from datetime import datetime, timedelta
 
+from harness.resultados import Registro
+
 BASE_URL = "http://localhost:3001/api"
 
 # Colores
@@ -24,8 +25,13 @@ passed = 0
 failed = 0
 results = []
 
+# Latencias, payloads y PASS/FAIL quedan en el almacén del harness (harness/resultados.py)
+registro = Registro("test-backend-portal-docente", base_url=BASE_URL)
+http = registro.session()
+
 def test(name, func):
     global passed, failed
+    registro.test_actual = name
     try:
         result = func()
         if result['success']:
@@ -34,16 +40,26 @@ def test(name, func):
             if 'details' in result and result['details']:
                 print(f"  └─ {result['details']}")
             results.append({'name': name, 'status': 'PASS', 'details': result.get('details', '')})
+            registro.registrar_test(name, 'PASS')
         else:
             failed += 1
             print(f"{RED}✗{NC} {name}")
             print(f"  └─ {result['error']}")
             results.append({'name': name, 'status': 'FAIL', 'error': result['error']})
+            registro.registrar_test(name, 'FAIL', result['error'])
     except Exception as e:
         failed += 1
         print(f"{RED}✗{NC} {name}")
         print(f"  └─ Exception: {str(e)}")
         results.append({'name': name, 'status': 'FAIL', 'error': str(e)})
+        registro.registrar_test(name, 'FAIL', str(e))
+
+def guardar_corrida():
+    try:
+        corrida_id = registro.guardar(passed, failed)
+        print(f"Corrida #{corrida_id} guardada (python -m harness.resultados tendencias)\n")
+    except Exception as e:
+        print(f"{YELLOW}⚠ No se pudo guardar la corrida: {e}{NC}\n")
 
 print(f"{BLUE}{'='*60}{NC}")
 print(f"{BLUE}  TEST INTEGRAL BACKEND - PORTAL DOCENTE{NC}")
@@ -55,7 +71,7 @@ print(f"{BLUE}{'='*60}{NC}\n")
 print(f"{CYAN}═══ MÓDULO 1: AUTENTICACIÓN ══════════════════════════════{NC}\n")
 
 def test_login():
-    r = requests.post(f"{BASE_URL}/auth/login", json={
+    r = http.post(f"{BASE_URL}/auth/login", json={
         "email": "docente@test.com",
         "password": "Test123!"
     })
@@ -73,7 +89,8 @@ def test_login():
 test("Login con docente@test.com", test_login)
 
 if failed > 0:
-    print(f"\n{RED}No se pudo autenticar. Abortando tests.{NC}")
+    print(f"\n{RED}No se pudo autenticar. Abortando tests.{NC}\n")
+    guardar_corrida()
     sys.exit(1)
 
 HEADERS = {'Authorization': f'Bearer {TOKEN}'}
@@ -85,14 +102,14 @@ print()
 print(f"{CYAN}═══ MÓDULO 2: PERFIL DOCENTE ═════════════════════════════{NC}\n")
 
 def test_get_profile():
-    r = requests.get(f"{BASE_URL}/docentes/me", headers=HEADERS)
+    r = http.get(f"{BASE_URL}/docentes/me", headers=HEADERS)
     if r.status_code == 200:
         data = r.json()
         return {'success': True, 'details': f"Nombre: {data.get('nombre', 'N/A')} {data.get('apellido', 'N/A')}"}
     return {'success': False, 'error': f'HTTP {r.status_code}: {r.text[:200]}'}
 
 def test_update_profile():
-    r = requests.patch(f"{BASE_URL}/docentes/me", headers=HEADERS, json={
+    r = http.patch(f"{BASE_URL}/docentes/me", headers=HEADERS, json={
         "bio": "Bio actualizada en test automatizado"
     })
     if r.status_code == 200:
@@ -109,7 +126,7 @@ print()
 print(f"{CYAN}═══ MÓDULO 3: ESTUDIANTES ════════════════════════════════{NC}\n")
 
 def test_get_estudiantes():
-    r = requests.get(f"{BASE_URL}/estudiantes", headers=HEADERS)
+    r = http.get(f"{BASE_URL}/estudiantes", headers=HEADERS)
     if r.status_code == 200:
         data = r.json()
         if len(data) > 0:
@@ -122,7 +139,7 @@ def test_get_estudiante_detail():
     if 'ESTUDIANTE_ID' not in globals():
         return {'success': False, 'error': 'No hay estudiantes para testear'}
 
-    r = requests.get(f"{BASE_URL}/estudiantes/{ESTUDIANTE_ID}", headers=HEADERS)
+    r = http.get(f"{BASE_URL}/estudiantes/{ESTUDIANTE_ID}", headers=HEADERS)
     if r.status_code == 200:
         data = r.json()
         return {'success': True, 'details': f"Estudiante: {data.get('nombre', 'N/A')}"}
@@ -138,7 +155,7 @@ print()
 print(f"{CYAN}═══ MÓDULO 4: RUTAS CURRICULARES ════════════════════════{NC}\n")
 
 def test_get_rutas():
-    r = requests.get(f"{BASE_URL}/admin/rutas-curriculares", headers=HEADERS)
+    r = http.get(f"{BASE_URL}/admin/rutas-curriculares", headers=HEADERS)
     if r.status_code == 200:
         data = r.json()
         if len(data) > 0:
@@ -151,7 +168,7 @@ def test_get_ruta_detail():
     if 'RUTA_ID' not in globals():
         return {'success': False, 'error': 'No hay rutas para testear'}
 
-    r = requests.get(f"{BASE_URL}/admin/rutas-curriculares/{RUTA_ID}", headers=HEADERS)
+    r = http.get(f"{BASE_URL}/admin/rutas-curriculares/{RUTA_ID}", headers=HEADERS)
     if r.status_code == 200:
         data = r.json()
         return {'success': True, 'details': f"Ruta: {data.get('nombre', 'N/A')}"}
@@ -167,7 +184,7 @@ print()
 print(f"{CYAN}═══ MÓDULO 5: CLASES ═════════════════════════════════════{NC}\n")
 
 def test_get_mis_clases():
-    r = requests.get(f"{BASE_URL}/clases/docente/mis-clases", headers=HEADERS)
+    r = http.get(f"{BASE_URL}/clases/docente/mis-clases", headers=HEADERS)
     if r.status_code == 200:
         data = r.json()
         return {'success': True, 'details': f"Mis clases: {len(data)}"}
@@ -180,7 +197,7 @@ def test_create_clase():
     fecha_inicio = (datetime.now() + timedelta(days=2)).isoformat()
     fecha_fin = (datetime.now() + timedelta(days=2, hours=1)).isoformat()
 
-    r = requests.post(f"{BASE_URL}/clases", headers=HEADERS, json={
+    r = http.post(f"{BASE_URL}/clases", headers=HEADERS, json={
         "titulo": "Clase de Test Automatizada",
         "descripcion": "Clase creada por test automatizado",
         "ruta_curricular_id": RUTA_ID,
@@ -201,7 +218,7 @@ def test_get_clase_detail():
     if 'CLASE_ID' not in globals():
         return {'success': False, 'error': 'No hay CLASE_ID (creación falló)'}
 
-    r = requests.get(f"{BASE_URL}/clases/{CLASE_ID}", headers=HEADERS)
+    r = http.get(f"{BASE_URL}/clases/{CLASE_ID}", headers=HEADERS)
     if r.status_code == 200:
         data = r.json()
         return {'success': True, 'details': f"Clase: {data.get('titulo', 'N/A')}"}
@@ -211,7 +228,7 @@ def test_cancel_clase():
     if 'CLASE_ID' not in globals():
         return {'success': False, 'error': 'No hay CLASE_ID (creación falló)'}
 
-    r = requests.patch(f"{BASE_URL}/clases/{CLASE_ID}/cancelar", headers=HEADERS)
+    r = http.patch(f"{BASE_URL}/clases/{CLASE_ID}/cancelar", headers=HEADERS)
 
     if r.status_code == 200:
         return {'success': True}
@@ -232,7 +249,7 @@ def test_get_asistencia_clase():
     if 'CLASE_ID' not in globals():
         return {'success': False, 'error': 'No hay CLASE_ID (creación falló)'}
 
-    r = requests.get(f"{BASE_URL}/asistencia/clase/{CLASE_ID}", headers=HEADERS)
+    r = http.get(f"{BASE_URL}/asistencia/clase/{CLASE_ID}", headers=HEADERS)
 
     if r.status_code == 200:
         data = r.json()
@@ -246,7 +263,7 @@ def test_registrar_asistencia():
     if 'ESTUDIANTE_ID' not in globals():
         return {'success': False, 'error': 'No hay estudiantes para registrar asistencia'}
 
-    r = requests.post(f"{BASE_URL}/asistencia", headers=HEADERS, json={
+    r = http.post(f"{BASE_URL}/asistencia", headers=HEADERS, json={
         "clase_id": CLASE_ID,
         "estudiante_id": ESTUDIANTE_ID,
         "presente": True,
@@ -263,7 +280,7 @@ def test_update_asistencia():
     if 'ASISTENCIA_ID' not in globals():
         return {'success': False, 'error': 'No hay ASISTENCIA_ID'}
 
-    r = requests.patch(f"{BASE_URL}/asistencia/{ASISTENCIA_ID}", headers=HEADERS, json={
+    r = http.patch(f"{BASE_URL}/asistencia/{ASISTENCIA_ID}", headers=HEADERS, json={
         "observaciones": "Actualizado por test"
     })
 
@@ -282,7 +299,7 @@ print()
 print(f"{CYAN}═══ MÓDULO 7: CALENDARIO/EVENTOS ════════════════════════{NC}\n")
 
 def test_create_tarea():
-    r = requests.post(f"{BASE_URL}/eventos/tareas", headers=HEADERS, json={
+    r = http.post(f"{BASE_URL}/eventos/tareas", headers=HEADERS, json={
         "titulo": "Tarea de Test",
         "tipo": "TAREA",
         "fecha_inicio": "2025-10-20T10:00:00.000Z",
@@ -297,7 +314,7 @@ def test_create_tarea():
     return {'success': False, 'error': f'HTTP {r.status_code}: {r.text[:200]}'}
 
 def test_create_recordatorio():
-    r = requests.post(f"{BASE_URL}/eventos/recordatorios", headers=HEADERS, json={
+    r = http.post(f"{BASE_URL}/eventos/recordatorios", headers=HEADERS, json={
         "titulo": "Recordatorio de Test",
         "tipo": "RECORDATORIO",
         "fecha_inicio": "2025-10-21T15:00:00.000Z",
@@ -311,7 +328,7 @@ def test_create_recordatorio():
     return {'success': False, 'error': f'HTTP {r.status_code}: {r.text[:200]}'}
 
 def test_create_nota():
-    r = requests.post(f"{BASE_URL}/eventos/notas", headers=HEADERS, json={
+    r = http.post(f"{BASE_URL}/eventos/notas", headers=HEADERS, json={
         "titulo": "Nota de Test",
         "tipo": "NOTA",
         "fecha_inicio": "2025-10-22T00:00:00.000Z",
@@ -325,14 +342,14 @@ def test_create_nota():
     return {'success': False, 'error': f'HTTP {r.status_code}: {r.text[:200]}'}
 
 def test_get_eventos():
-    r = requests.get(f"{BASE_URL}/eventos", headers=HEADERS)
+    r = http.get(f"{BASE_URL}/eventos", headers=HEADERS)
     if r.status_code == 200:
         data = r.json()
         return {'success': True, 'details': f"Total eventos: {len(data)}"}
     return {'success': False, 'error': f'HTTP {r.status_code}: {r.text[:200]}'}
 
 def test_vista_agenda():
-    r = requests.get(f"{BASE_URL}/eventos/vista-agenda", headers=HEADERS)
+    r = http.get(f"{BASE_URL}/eventos/vista-agenda", headers=HEADERS)
     if r.status_code == 200:
         data = r.json()
         keys = ['hoy', 'manana', 'proximos7Dias', 'masAdelante']
@@ -343,13 +360,13 @@ def test_vista_agenda():
     return {'success': False, 'error': f'HTTP {r.status_code}: {r.text[:200]}'}
 
 def test_vista_semana():
-    r = requests.get(f"{BASE_URL}/eventos/vista-semana", headers=HEADERS)
+    r = http.get(f"{BASE_URL}/eventos/vista-semana", headers=HEADERS)
     if r.status_code == 200:
         return {'success': True}
     return {'success': False, 'error': f'HTTP {r.status_code}: {r.text[:200]}'}
 
 def test_estadisticas():
-    r = requests.get(f"{BASE_URL}/eventos/estadisticas", headers=HEADERS)
+    r = http.get(f"{BASE_URL}/eventos/estadisticas", headers=HEADERS)
     if r.status_code == 200:
         data = r.json()
         return {'success': True, 'details': f"Keys: {list(data.keys())}"}
@@ -373,7 +390,7 @@ def test_get_perfil_estudiante_gamificacion():
     if 'ESTUDIANTE_ID' not in globals():
         return {'success': False, 'error': 'No hay estudiantes'}
 
-    r = requests.get(f"{BASE_URL}/gamificacion/perfil/{ESTUDIANTE_ID}", headers=HEADERS)
+    r = http.get(f"{BASE_URL}/gamificacion/perfil/{ESTUDIANTE_ID}", headers=HEADERS)
 
     if r.status_code == 200:
         data = r.json()
@@ -384,7 +401,7 @@ def test_registrar_experiencia():
     if 'ESTUDIANTE_ID' not in globals():
         return {'success': False, 'error': 'No hay estudiantes'}
 
-    r = requests.post(f"{BASE_URL}/gamificacion/experiencia", headers=HEADERS, json={
+    r = http.post(f"{BASE_URL}/gamificacion/experiencia", headers=HEADERS, json={
         "estudiante_id": ESTUDIANTE_ID,
         "puntos": 50,
         "razon": "Test automatizado",
@@ -399,7 +416,7 @@ def test_get_logros():
     if 'ESTUDIANTE_ID' not in globals():
         return {'success': False, 'error': 'No hay estudiantes'}
 
-    r = requests.get(f"{BASE_URL}/gamificacion/logros/{ESTUDIANTE_ID}", headers=HEADERS)
+    r = http.get(f"{BASE_URL}/gamificacion/logros/{ESTUDIANTE_ID}", headers=HEADERS)
 
     if r.status_code == 200:
         data = r.json()
@@ -417,20 +434,20 @@ print()
 print(f"{CYAN}═══ MÓDULO 9: CATÁLOGO/PRODUCTOS ════════════════════════{NC}\n")
 
 def test_get_productos():
-    r = requests.get(f"{BASE_URL}/productos", headers=HEADERS)
+    r = http.get(f"{BASE_URL}/productos", headers=HEADERS)
     if r.status_code == 200:
         data = r.json()
         return {'success': True, 'details': f"Productos disponibles: {len(data)}"}
     return {'success': False, 'error': f'HTTP {r.status_code}: {r.text[:200]}'}
 
 def test_get_producto_detail():
-    r = requests.get(f"{BASE_URL}/productos", headers=HEADERS)
+    r = http.get(f"{BASE_URL}/productos", headers=HEADERS)
     if r.status_code != 200 or len(r.json()) == 0:
         return {'success': False, 'error': 'No hay productos'}
 
     producto_id = r.json()[0]['id']
 
-    r2 = requests.get(f"{BASE_URL}/productos/{producto_id}", headers=HEADERS)
+    r2 = http.get(f"{BASE_URL}/productos/{producto_id}", headers=HEADERS)
 
     if r2.status_code == 200:
         data = r2.json()
@@ -447,7 +464,7 @@ print()
 print(f"{CYAN}═══ MÓDULO 10: NOTIFICACIONES ════════════════════════════{NC}\n")
 
 def test_get_notificaciones():
-    r = requests.get(f"{BASE_URL}/notificaciones", headers=HEADERS)
+    r = http.get(f"{BASE_URL}/notificaciones", headers=HEADERS)
     if r.status_code == 200:
         data = r.json()
         return {'success': True, 'details': f"Notificaciones: {len(data)}"}
@@ -456,7 +473,7 @@ def test_get_notificaciones():
     return {'success': False, 'error': f'HTTP {r.status_code}: {r.text[:200]}'}
 
 def test_marcar_leida():
-    r = requests.get(f"{BASE_URL}/notificaciones", headers=HEADERS)
+    r = http.get(f"{BASE_URL}/notificaciones", headers=HEADERS)
     if r.status_code != 200:
         return {'success': False, 'error': 'No se pueden obtener notificaciones'}
 
@@ -466,7 +483,7 @@ def test_marcar_leida():
 
     notif_id = data[0]['id']
 
-    r2 = requests.patch(f"{BASE_URL}/notificaciones/{notif_id}/leida", headers=HEADERS)
+    r2 = http.patch(f"{BASE_URL}/notificaciones/{notif_id}/leida", headers=HEADERS)
 
     if r2.status_code == 200:
         return {'success': True}
@@ -484,7 +501,7 @@ print(f"{CYAN}═══ LIMPIEZA DE DATOS DE PRUEBA ═════════
 def cleanup_tarea():
     if 'TAREA_ID' not in globals():
         return {'success': True, 'details': 'No hay tarea para eliminar'}
-    r = requests.delete(f"{BASE_URL}/eventos/{TAREA_ID}", headers=HEADERS)
+    r = http.delete(f"{BASE_URL}/eventos/{TAREA_ID}", headers=HEADERS)
     if r.status_code == 200:
         return {'success': True}
     return {'success': False, 'error': f'HTTP {r.status_code}'}
@@ -492,7 +509,7 @@ def cleanup_tarea():
 def cleanup_recordatorio():
     if 'RECORDATORIO_ID' not in globals():
         return {'success': True, 'details': 'No hay recordatorio para eliminar'}
-    r = requests.delete(f"{BASE_URL}/eventos/{RECORDATORIO_ID}", headers=HEADERS)
+    r = http.delete(f"{BASE_URL}/eventos/{RECORDATORIO_ID}", headers=HEADERS)
     if r.status_code == 200:
         return {'success': True}
     return {'success': False, 'error': f'HTTP {r.status_code}'}
@@ -500,7 +517,7 @@ def cleanup_recordatorio():
 def cleanup_nota():
     if 'NOTA_ID' not in globals():
         return {'success': True, 'details': 'No hay nota para eliminar'}
-    r = requests.delete(f"{BASE_URL}/eventos/{NOTA_ID}", headers=HEADERS)
+    r = http.delete(f"{BASE_URL}/eventos/{NOTA_ID}", headers=HEADERS)
     if r.status_code == 200:
         return {'success': True}
     return {'success': False, 'error': f'HTTP {r.status_code}'}
@@ -508,7 +525,7 @@ def cleanup_nota():
 def cleanup_clase():
     if 'CLASE_ID' not in globals():
         return {'success': True, 'details': 'No hay clase para eliminar'}
-    r = requests.delete(f"{BASE_URL}/clases/{CLASE_ID}", headers=HEADERS)
+    r = http.delete(f"{BASE_URL}/clases/{CLASE_ID}", headers=HEADERS)
     if r.status_code == 200:
         return {'success': True}
     return {'success': False, 'error': f'HTTP {r.status_code}'}
@@ -546,4 +563,5 @@ if failed > 0:
 else:
     print(f"{GREEN}🎉 TODOS LOS TESTS DEL BACKEND PASARON EXITOSAMENTE{NC}\n")
 
+guardar_corrida()
 sys.exit(0 if failed == 0 else 1)